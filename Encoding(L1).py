@@ -1,40 +1,54 @@
-import math
+import argparse
+import itertools
+import sys
 
-def binary_to_decimal():
-    binary_str = input("Введите бинарное число (например, 1110011110): ").strip()
-    return int(binary_str, 2)
+from csa import cache, encoding
 
-def binary_to_hex():
-    binary_str = input("Введите бинарное число с пробелами (например, 1001 0011 1000): ").strip()
-    return hex(int(binary_str.replace(" ", ""), 2))[2:].upper()
+# Без аргумента функции спрашивают значение через input(), с аргументом — чистые
+# (так их использует пакетный режим --batch). Сами вычисления — в csa.encoding.
 
-def min_bits_needed():
-    min_val = int(input("Введите минимальное значение (например, 58): "))
-    max_val = int(input("Введите максимальное значение (например, 101): "))
-    return math.ceil(math.log2(max_val - min_val + 1))
+def binary_to_decimal(binary_str=None):
+    if binary_str is None:
+        binary_str = input("Введите бинарное число (например, 1110011110): ")
+    return encoding.binary_to_decimal(binary_str)
 
-def hex_to_binary():
-    hex_str = input("Введите шестнадцатеричное число без #: ").strip()
-    return bin(int(hex_str, 16))[2:]
+def binary_to_hex(binary_str=None):
+    if binary_str is None:
+        binary_str = input("Введите бинарное число с пробелами (например, 1001 0011 1000): ")
+    return encoding.binary_to_hex(binary_str)
 
-def even_parity_bit():
-    binary_str = input("Введите последовательность битов (например, 0011 1110 0): ").strip()
-    total_ones = binary_str.replace(" ", "").count("1")
-    return '0' if total_ones % 2 == 0 else '1'
+def min_bits_needed(min_val=None, max_val=None):
+    if min_val is None:
+        min_val = int(input("Введите минимальное значение (например, 58): "))
+    if max_val is None:
+        max_val = int(input("Введите максимальное значение (например, 101): "))
+    return encoding.min_bits_needed(min_val, max_val)
 
-def odd_parity_bit():
-    binary_str = input("Введите последовательность битов (например, 0011 1110 0): ").strip()
-    total_ones = binary_str.replace(" ", "").count("1")
-    return '1' if total_ones % 2 == 0 else '0'
+def hex_to_binary(hex_str=None):
+    if hex_str is None:
+        hex_str = input("Введите шестнадцатеричное число без #: ")
+    return encoding.hex_to_binary(hex_str)
 
-def hex_to_decimal():
-    hex_str = input("Введите шестнадцатеричное число без #: ").strip()
-    return int(hex_str, 16)
+def even_parity_bit(binary_str=None):
+    if binary_str is None:
+        binary_str = input("Введите последовательность битов (например, 0011 1110 0): ")
+    return encoding.even_parity_bit(binary_str)
 
-def bits_needed_for_states():
-    print("Введите состояния контроллера через запятую (например: R,YR,Y,G,none):")
-    states = input().strip().split(",")
-    return math.ceil(math.log2(len(states)))
+def odd_parity_bit(binary_str=None):
+    if binary_str is None:
+        binary_str = input("Введите последовательность битов (например, 0011 1110 0): ")
+    return encoding.odd_parity_bit(binary_str)
+
+def hex_to_decimal(hex_str=None):
+    if hex_str is None:
+        hex_str = input("Введите шестнадцатеричное число без #: ")
+    return encoding.hex_to_decimal(hex_str)
+
+def bits_needed_for_states(states=None):
+    if states is None:
+        print("Введите состояния контроллера через запятую (например: R,YR,Y,G,none):")
+        states = input()
+    return encoding.bits_needed_for_states(states)
 
 def print_menu():
     print("\nВыберите задачу:")
@@ -78,6 +92,70 @@ def main():
         except Exception as e:
             print("Ошибка:", e)
 
+# Номер задачи -> функция, которая получает одну строку входа (без '\n')
+BATCH_TASKS = {
+    '1': encoding.binary_to_decimal,
+    '2': encoding.binary_to_hex,
+    '3': lambda line: encoding.min_bits_needed(*map(int, line.replace(",", " ").split())),
+    '4': encoding.hex_to_binary,
+    '5': encoding.even_parity_bit,
+    '6': encoding.odd_parity_bit,
+    '7': encoding.hex_to_decimal,
+    '8': encoding.bits_needed_for_states,
+}
+
+def run_batch(task, infile, outfile, chunk_size=65536, cache_size=0):
+    """
+    Streams newline-delimited records through one task, chunk_size lines at a time.
+    Every input line produces exactly one output line; bad records become 'Ошибка: ...'.
+    With cache_size > 0 repeated records are answered from an LRU cache.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size должен быть положительным")
+    convert = BATCH_TASKS[task]
+    if cache_size:
+        convert = cache.cached(convert, cache_size)
+    lines = iter(infile)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        results = []
+        for line in chunk:
+            try:
+                results.append(str(convert(line.rstrip("\r\n"))))
+            except Exception as e:
+                results.append(f"Ошибка: {e}")
+        results.append("")
+        outfile.write("\n".join(results))
+    outfile.flush()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Задачи кодирования (L1). Без --batch запускается меню.")
+    parser.add_argument("--batch", metavar="TASK", choices=sorted(BATCH_TASKS),
+                        help="номер задачи для пакетного режима (1-8)")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="файл с записями, по одной на строку ('-' = stdin)")
+    parser.add_argument("--chunk-size", type=int, default=65536,
+                        help="сколько строк обрабатывать за один проход")
+    parser.add_argument("--cache", type=int, default=0, metavar="SIZE",
+                        help="кэшировать до SIZE повторяющихся записей (статистика в stderr)")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size должен быть положительным")
+    if args.cache < 0:
+        parser.error("--cache не может быть отрицательным")
+    return args
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.batch is None:
+        main()
+    elif args.input == "-":
+        run_batch(args.batch, sys.stdin, sys.stdout, args.chunk_size, args.cache)
+    else:
+        with open(args.input, encoding="utf-8", buffering=1 << 20) as f:
+            run_batch(args.batch, f, sys.stdout, args.chunk_size, args.cache)
+    if args.batch is not None and args.cache:
+        cache.report()
 
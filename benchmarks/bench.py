@@ -0,0 +1,256 @@
+"""
+Benchmarks for the csa conversion and arithmetic routines.
+
+Every dataset is generated from a fixed seed, so two runs on the same
+machine measure the same inputs. Each routine is timed per dataset size
+(ops/sec) and then run once more under tracemalloc for its peak memory.
+Results go to a JSON file that a later run can be compared against:
+
+    python benchmarks/bench.py -o base.json
+    python benchmarks/bench.py --sizes single,1e4,1e6,4096bit --compare base.json
+
+Scalar routines are called once per value; the NumPy batch routines
+(skipped without NumPy) are called once per dataset and counted per element.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csa import bcd, conversions, encoding, fxp, unicode, utf8  # noqa: E402
+
+try:
+    import numpy as np
+    from csa import alu, gray, signed
+except ImportError:
+    np = None
+
+SEED = 20240601
+# size name -> (number of values, operand width in bits; None = routine default)
+SIZES = {
+    "single": (1, None),
+    "1e4": (10_000, None),
+    "1e6": (1_000_000, None),
+    "4096bit": (1_000, 4096),
+}
+DEFAULT_SIZES = "single,1e4,4096bit"
+
+
+def _bits(rng, n):
+    return format(rng.getrandbits(n), f"0{n}b")
+
+
+def _utf8_bits(rng, _):
+    return utf8.format_bits(chr(rng.choice((0x41, 0xE9, 0x20AC, 0x1F600, rng.randrange(0x80, 0xD800)))).encode())
+
+
+def _bcd_bits(rng, n):
+    return "".join(format(rng.randrange(10), "04b") for _ in range(max(n // 4, 1)))
+
+
+def _hex(rng, n):
+    return format(rng.getrandbits(n), f"0{max(-(-n // 4), 1)}X")
+
+
+def _gray_run(rng, n, length=32):
+    """A valid Gray sequence, so the order check scans all of it."""
+    code = rng.getrandbits(n)
+    codes = []
+    for _ in range(length):
+        codes.append(format(code, f"0{n}b"))
+        code ^= 1 << rng.randrange(n)
+    return codes
+
+
+def _states(rng):
+    return ",".join(f"S{i}" for i in range(rng.randint(2, 40)))
+
+
+def _base14(rng, n):
+    digits = "0123456789ABCD"
+    return "".join(rng.choice(digits) for _ in range(n)) + "." + "".join(rng.choice(digits) for _ in range(4))
+
+
+# name -> (function, argument generator (rng, bits) -> tuple, default bits, runs on 4096-bit data)
+SCALAR = {
+    "fxp.add_binary": (fxp.add_binary, lambda r, n: (_bits(r, n), _bits(r, n), r.randint(0, 1), "U2"), 8, True),
+    "fxp.add_binary_u1": (fxp.add_binary, lambda r, n: (_bits(r, n), _bits(r, n), r.randint(0, 1), "U1"), 8, True),
+    "fxp.bin_to_dec": (fxp.bin_to_dec, lambda r, n: (_bits(r, n), n, "U2"), 16, True),
+    "fxp.negate_u2": (fxp.negate_u2, lambda r, n: (_bits(r, n),), 16, True),
+    "fxp.negate_u1": (fxp.negate_u1, lambda r, n: (_bits(r, n),), 16, True),
+    "fxp.negate_sm": (fxp.negate_sm, lambda r, n: (_bits(r, n),), 16, True),
+    "fxp.extend_u": (fxp.extend_u, lambda r, n: (_bits(r, n), 2 * n), 16, True),
+    "fxp.extend_sm": (fxp.extend_sm, lambda r, n: (_bits(r, n), 2 * n), 16, True),
+    "conversions.binary_to_gray": (conversions.binary_to_gray, lambda r, n: (_bits(r, n),), 16, True),
+    "conversions.gray_to_binary": (conversions.gray_to_binary, lambda r, n: (_bits(r, n),), 16, True),
+    "conversions.U2_to_decimal": (conversions.U2_to_decimal, lambda r, n: (_bits(r, n),), 16, True),
+    "conversions.U1_to_decimal": (conversions.U1_to_decimal, lambda r, n: (_bits(r, n),), 16, True),
+    "conversions.sign_magnitude_to_decimal": (
+        conversions.sign_magnitude_to_decimal, lambda r, n: (_bits(r, n),), 16, True),
+    "conversions.biased_to_decimal": (conversions.biased_to_decimal, lambda r, n: (_bits(r, n),), 16, True),
+    "conversions.hex_to_decimal_U2": (conversions.hex_to_decimal_U2, lambda r, n: ("#" + _hex(r, 12),), 12, False),
+    "conversions.hex_to_decimal_U1": (conversions.hex_to_decimal_U1, lambda r, n: ("#" + _hex(r, 12),), 12, False),
+    "conversions.hex_to_decimal_sign_magnitude": (
+        conversions.hex_to_decimal_sign_magnitude, lambda r, n: ("#" + _hex(r, 12),), 12, False),
+    "conversions.hex_to_decimal": (conversions.hex_to_decimal, lambda r, n: ("#" + _hex(r, n),), 16, True),
+    "conversions.base14_to_decimal": (conversions.base14_to_decimal, lambda r, n: (_base14(r, 6),), 6, False),
+    "conversions.binary_to_decimal": (
+        conversions.binary_to_decimal, lambda r, n: (_bits(r, n) + "." + _bits(r, 8),), 16, False),
+    "conversions.binary_fraction_to_decimal": (
+        conversions.binary_fraction_to_decimal, lambda r, n: ("0." + _bits(r, n),), 16, True),
+    "conversions.detect_gray_code_order_error": (
+        conversions.detect_gray_code_order_error, lambda r, n: (_gray_run(r, n),), 16, False),
+    "conversions.bcd_to_decimal": (conversions.bcd_to_decimal, lambda r, n: (_bcd_bits(r, n),), 32, True),
+    "conversions.decimal_to_bcd": (conversions.decimal_to_bcd, lambda r, n: (r.getrandbits(n),), 32, False),
+    "encoding.binary_to_decimal": (encoding.binary_to_decimal, lambda r, n: (_bits(r, n),), 16, True),
+    "encoding.binary_to_hex": (encoding.binary_to_hex, lambda r, n: (_bits(r, n),), 16, True),
+    "encoding.hex_to_binary": (encoding.hex_to_binary, lambda r, n: (_hex(r, n),), 16, True),
+    "encoding.hex_to_decimal": (encoding.hex_to_decimal, lambda r, n: (_hex(r, n),), 16, True),
+    "encoding.even_parity_bit": (encoding.even_parity_bit, lambda r, n: (_bits(r, n),), 16, True),
+    "encoding.odd_parity_bit": (encoding.odd_parity_bit, lambda r, n: (_bits(r, n),), 16, True),
+    "encoding.min_bits_needed": (
+        encoding.min_bits_needed, lambda r, n: (-r.getrandbits(n), r.getrandbits(n)), 16, False),
+    "encoding.bits_needed_for_states": (encoding.bits_needed_for_states, lambda r, n: (_states(r),), 8, False),
+    "unicode.codepoint_bits_to_utf8": (
+        unicode.codepoint_bits_to_utf8, lambda r, n: (format(r.randrange(0xD800), "032b"),), 32, False),
+    "unicode.shortest_utf8": (unicode.shortest_utf8, lambda r, n: (_utf8_bits(r, n),), 8, False),
+    "unicode.utf8_to_ascii_bits": (unicode.utf8_to_ascii_bits, lambda r, n: (_utf8_bits(r, n),), 8, False),
+    "unicode.padded_utf8": (unicode.padded_utf8, lambda r, n: (_utf8_bits(r, n),), 8, False),
+}
+
+
+def _batch_routines():
+    if np is None:
+        return {}
+
+    def words(rng, count, bits):
+        return np.random.default_rng(rng.getrandbits(32)).integers(0, 1 << bits, count, dtype=np.uint64)
+
+    return {
+        "signed.decode_u2": (lambda r, c: (words(r, c, 12), 12, "U2"), signed.decode),
+        "alu.add_batch": (lambda r, c: (words(r, c, 32), words(r, c, 32), 0, 32, "U1"), alu.add_batch),
+        "gray.decode": (lambda r, c: (words(r, c, 16).astype(np.uint16),), gray.decode),
+        "bcd.unpack": (lambda r, c: (bcd.pack("".join(str(r.randrange(10)) for _ in range(2 * c))),), bcd.unpack),
+    }
+
+
+def _measure(run, min_time: float) -> float:
+    """Seconds per run() call, repeating until min_time has passed."""
+    run()  # warm-up
+    repeats = 0
+    start = time.perf_counter()
+    while True:
+        run()
+        repeats += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / repeats
+
+
+def _peak_bytes(run) -> int:
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes, only=None, min_time: float = 0.2):
+    results = []
+    for size in sizes:
+        count, width = SIZES[size]
+        for name, (func, make_args, default_bits, long_ok) in SCALAR.items():
+            if (only and only not in name) or (width and not long_ok):
+                continue
+            rng = random.Random(f"{SEED}:{name}:{size}")
+            data = [make_args(rng, width or default_bits) for _ in range(count)]
+
+            def run():
+                for args in data:
+                    func(*args)
+
+            per_run = _measure(run, min_time)
+            results.append({"routine": name, "size": size, "ops": count,
+                            "ops_per_sec": count / per_run, "peak_bytes": _peak_bytes(run)})
+            print(f"{name:44} {size:8} {count / per_run:14,.0f} ops/s", file=sys.stderr)
+
+        if width:
+            continue
+        for name, (make_args, func) in _batch_routines().items():
+            if only and only not in name:
+                continue
+            args = make_args(random.Random(f"{SEED}:{name}:{size}"), count)
+
+            def run():
+                func(*args)
+
+            per_run = _measure(run, min_time)
+            results.append({"routine": name, "size": size, "ops": count,
+                            "ops_per_sec": count / per_run, "peak_bytes": _peak_bytes(run)})
+            print(f"{name:44} {size:8} {count / per_run:14,.0f} ops/s", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline_path, threshold: float = 0.10) -> int:
+    """Prints new/old speed per routine; returns the number of regressions beyond threshold."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["routine"], r["size"]): r for r in json.load(f)["results"]}
+    regressions = 0
+    for r in results:
+        old = baseline.get((r["routine"], r["size"]))
+        if old is None:
+            continue
+        ratio = r["ops_per_sec"] / old["ops_per_sec"]
+        mark = ""
+        if ratio < 1 - threshold:
+            mark = "  REGRESSION"
+            regressions += 1
+        elif ratio > 1 + threshold:
+            mark = "  faster"
+        print(f"{r['routine']:44} {r['size']:8} x{ratio:6.2f}{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the csa routines.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma-separated from {', '.join(SIZES)}")
+    parser.add_argument("--only", help="run only routines whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to spend per measurement")
+    parser.add_argument("-o", "--output", help="write results as JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON from an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+
+    results = run_benchmarks(sizes, args.only, args.min_time)
+    if args.output:
+        report = {
+            "meta": {
+                "seed": SEED,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": np.__version__ if np is not None else None,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Regression check of the rewritten routines against the behaviour they replaced.
+
+The pre-rewrite implementations are kept below as frozen copies taken from
+the original menu scripts (the UTF-8 tasks share one copy of their identical
+lead-byte cascade). Each check feeds the same randomized inputs to the old and
+the new code and counts differing answers:
+
+    adder    fxp.add_binary vs the old bit-by-bit ripple adder
+    utf8     unicode.shortest_utf8 / utf8_to_ascii_bits / padded_utf8 vs the
+             old L3 tasks 2-4 ("-1" there is ValueError here)
+    base14   conversions.base14_to_decimal vs the old float loop; where they
+             differ, the new answer must be at least as close to the exact
+             value (the old sum picks up float error at rounding ties)
+    trace    trace.replay on rows generated with the scalar fxp routines:
+             only the rows with injected faults may be reported
+
+Inputs the old code crashed on (e.g. a 1-bit U1 add) are skipped. Every
+check returns (mismatches, note); the note counts skipped or tolerated inputs.
+
+    python checks/reference.py [--count 100000] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csa import conversions, fxp, radix, unicode  # noqa: E402
+
+
+# --- frozen pre-rewrite implementations ---------------------------------------
+
+def _old_bin_to_dec(binary_str, bits, code_type):
+    if code_type == "U2":
+        return int(binary_str, 2) - (1 << bits) if binary_str[0] == '1' else int(binary_str, 2)
+    if binary_str[0] == '1':
+        inverted_magnitude = ''.join(['1' if bit == '0' else '0' for bit in binary_str[1:]])
+        return -int(inverted_magnitude, 2)
+    return int(binary_str, 2)
+
+
+def _old_sign_extend(binary_str, target_bits):
+    current_bits = len(binary_str)
+    if current_bits >= target_bits:
+        return binary_str
+    return binary_str[0] * (target_bits - current_bits) + binary_str
+
+
+def _old_add_binary(num1_str, num2_str, incoming_carry, code_type):
+    bits = max(len(num1_str), len(num2_str))
+    num1 = _old_sign_extend(num1_str, bits)
+    num2 = _old_sign_extend(num2_str, bits)
+    sum_bits = [''] * bits
+    carries = [''] * (bits + 1)
+    current_carry = incoming_carry
+    carries[0] = str(incoming_carry)
+    for i in range(bits - 1, -1, -1):
+        bit1, bit2 = int(num1[i]), int(num2[i])
+        s = bit1 ^ bit2 ^ current_carry
+        c = (bit1 & bit2) | (bit1 & current_carry) | (bit2 & current_carry)
+        sum_bits[i] = str(s)
+        carries[bits - i] = str(c)
+        current_carry = c
+    final_sum = "".join(sum_bits)
+    C = int(carries[bits])
+    if code_type == "U1" and C == 1:
+        final_sum = bin(int(final_sum, 2) + 1)[2:].zfill(bits)
+        if len(final_sum) > bits:
+            final_sum = final_sum[-bits:]
+    N = int(final_sum[0])
+    Z = 1 if int(final_sum, 2) == 0 else 0
+    V = 0
+    if code_type == "U2":
+        V = int(carries[bits - 1]) ^ int(carries[bits])
+    else:
+        val1 = _old_bin_to_dec(num1, bits, code_type)
+        val2 = _old_bin_to_dec(num2, bits, code_type)
+        res = _old_bin_to_dec(final_sum, bits, code_type)
+        if (val1 >= 0 and val2 >= 0) or (val1 < 0 and val2 < 0):
+            if (val1 >= 0 and res < 0) or (val1 < 0 and res >= 0):
+                V = 1
+    return final_sum, "".join(carries[bits::-1]), N, Z, V, C
+
+
+_OLD_LEADS = (('0', 1, 1), ('110', 2, 3), ('1110', 3, 4), ('11110', 4, 5), ('111110', 5, 6), ('1111110', 6, 7))
+
+
+def _old_info_bits(groups):
+    """The lead-byte cascade of the old tasks 2-4; None where they answered "-1"."""
+    first = groups[0]
+    for prefix, min_bytes, skip in _OLD_LEADS:
+        if first.startswith(prefix):
+            if prefix == '0':
+                if len(groups) != 1:
+                    return None
+            elif len(groups) < min_bytes or not all(b.startswith('10') for b in groups[1:]):
+                return None
+            return first[skip:] + "".join(b[2:] for b in groups[1:])
+    return None
+
+
+def _old_checked_groups(bytes_str):
+    groups = bytes_str.strip().split()
+    if not groups or not all(len(b) == 8 and all(bit in '01' for bit in b) for b in groups):
+        return None
+    return groups
+
+
+def _old_task_2(bytes_str):
+    groups = _old_checked_groups(bytes_str)
+    bits = groups and _old_info_bits(groups)
+    if not bits:
+        return "-1"
+    codepoint = int(bits, 2)
+    if codepoint > 0x10FFFF:
+        return "-1"
+    try:
+        return '.'.join(f"{b:08b}" for b in chr(codepoint).encode('utf-8'))
+    except UnicodeEncodeError:
+        return "-1"
+
+
+def _old_task_3(bytes_str):
+    groups = _old_checked_groups(bytes_str)
+    bits = groups and _old_info_bits(groups)
+    if not bits or int(bits, 2) > 0x10FFFF:
+        return "-1"
+    return f"{int(bits, 2) & 0x7F:07b}"
+
+
+def _old_task_4(bytes_str):
+    groups = _old_checked_groups(bytes_str)
+    bits = groups and _old_info_bits(groups)
+    if bits is None:
+        return "-1"
+    bits = '00' + bits
+    schemes = ((1, '0', 7, 7), (2, '110', 5, 11), (3, '1110', 4, 16),
+               (4, '11110', 3, 21), (5, '111110', 2, 26), (6, '1111110', 1, 31))
+    for n_bytes, header, header_bits, capacity in schemes:
+        if capacity >= len(bits):
+            full = '0' * (capacity - len(bits)) + bits
+            out = [int(header + full[:header_bits], 2)]
+            rest = full[header_bits:]
+            out += [int('10' + rest[i * 6:(i + 1) * 6], 2) for i in range(n_bytes - 1)]
+            return '.'.join(f"{b:08b}" for b in out)
+    return "-1"
+
+
+def _old_base14_to_decimal(number):
+    number = number.strip().upper()
+    digits = '0123456789ABCD'
+    int_part, _, frac_part = number.partition('.')
+    result = 0
+    for i, d in enumerate(reversed(int_part)):
+        result += digits.index(d) * (14 ** i)
+    for i, d in enumerate(frac_part):
+        result += digits.index(d) * (14 ** -(i + 1))
+    return round(result, 3)
+
+
+# --- checks -------------------------------------------------------------------
+
+def _bits(rng, n):
+    return format(rng.getrandbits(n), f"0{n}b")
+
+
+def check_adder(rng, count):
+    mismatches = skipped = 0
+    for _ in range(count):
+        code_type = rng.choice(("U1", "U2"))
+        n1 = rng.choice((rng.randint(1, 16), rng.randint(17, 128)))
+        n2 = n1 if rng.random() < 0.7 else rng.randint(1, 128)
+        args = (_bits(rng, n1), _bits(rng, n2), rng.randint(0, 1), code_type)
+        try:
+            expected = _old_add_binary(*args)
+        except Exception:
+            skipped += 1
+            continue
+        if fxp.add_binary(*args) != expected:
+            mismatches += 1
+    return mismatches, f"{skipped} skipped, old code crashed" if skipped else ""
+
+
+def _utf8_input(rng):
+    length = rng.randint(1, 7)
+    lead = rng.choice((rng.getrandbits(8), rng.choice((0x00, 0xC0, 0xE0, 0xF0, 0xF8, 0xFC)) | rng.getrandbits(2)))
+    data = [lead] + [(0x80 | rng.getrandbits(6)) if rng.random() < 0.9 else rng.getrandbits(8)
+                     for _ in range(length - 1)]
+    return " ".join(format(b, "08b") for b in data)
+
+
+def check_utf8(rng, count):
+    mismatches = 0
+    pairs = ((_old_task_2, unicode.shortest_utf8), (_old_task_3, unicode.utf8_to_ascii_bits),
+             (_old_task_4, unicode.padded_utf8))
+    for _ in range(count):
+        text = _utf8_input(rng)
+        for old, new in pairs:
+            try:
+                got = new(text)
+            except ValueError:
+                got = "-1"
+            if got != old(text):
+                mismatches += 1
+    return mismatches, ""
+
+
+def check_base14(rng, count):
+    digits = "0123456789ABCDabcd"
+    mismatches = closer = 0
+    for _ in range(count):
+        number = "".join(rng.choice(digits) for _ in range(rng.randint(1, 8)))
+        if rng.random() < 0.7:
+            number += "." + "".join(rng.choice(digits) for _ in range(rng.randint(1, 6)))
+        new, old = conversions.base14_to_decimal(number), _old_base14_to_decimal(number)
+        if new != old:
+            exact = radix.parse(number.upper(), 14)
+            if abs(Fraction(new) - exact) <= abs(Fraction(old) - exact):
+                closer += 1
+            else:
+                mismatches += 1
+    return mismatches, f"{closer} differ, new at least as close to the exact value" if closer else ""
+
+
+def _nz(result):
+    return (8 if result[0] == '1' else 0) | (4 if int(result, 2) == 0 else 0)
+
+
+def check_trace(rng, count):
+    import numpy as np
+    from csa import trace
+
+    rows = {name: [] for name in ("opcode", "width", "a", "b", "expected", "flags")}
+    for _ in range(count):
+        op = rng.randrange(len(trace.OPCODES))
+        width = rng.randint(2, 64)
+        a = _bits(rng, width)
+        b, carry = 0, 0
+        if op in (trace.ADD_U2, trace.ADD_U1):
+            carry = rng.randint(0, 1)
+            b = rng.getrandbits(width)
+            result, _, N, Z, V, C = fxp.add_binary(a, format(b, f"0{width}b"), carry,
+                                                   "U2" if op == trace.ADD_U2 else "U1")
+            flags = N << 3 | Z << 2 | V << 1 | C
+        elif op in (trace.NEG_U2, trace.NEG_U1):
+            result, N, Z, V, C = (fxp.negate_u2 if op == trace.NEG_U2 else fxp.negate_u1)(a)
+            flags = N << 3 | Z << 2 | V << 1 | C
+        elif op == trace.NEG_SM:
+            result = fxp.negate_sm(a)
+            flags = _nz(result)
+        else:
+            b = rng.randint(1, width)
+            a = a[-b:]
+            result = (fxp.extend_u if op == trace.EXT_U else fxp.extend_sm)(a, width)
+            flags = _nz(result)
+        for name, value in (("opcode", op | (trace.CARRY_IN if carry else 0)), ("width", width),
+                            ("a", int(a, 2)), ("b", b), ("expected", int(result, 2)), ("flags", flags)):
+            rows[name].append(value)
+
+    faults = sorted(rng.sample(range(count), min(3, count)))
+    for row in faults:
+        rows["flags"][row] ^= 1
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "check.trc")
+        trace.write(path, **{name: np.array(values, dtype=np.uint64) for name, values in rows.items()})
+        reported = [int(m["row"]) for chunk in trace.replay(path) for m in chunk]
+    return (0 if reported == faults else 1), f"{len(reported)} row(s) reported, {len(faults)} fault(s) injected"
+
+
+CHECKS = {"adder": check_adder, "utf8": check_utf8, "base14": check_base14, "trace": check_trace}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the rewritten routines with the old behaviour.")
+    parser.add_argument("--count", type=int, default=100_000, help="random inputs per check")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--only", choices=sorted(CHECKS))
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for name, check in CHECKS.items():
+        if args.only and name != args.only:
+            continue
+        mismatches, note = check(random.Random(f"{args.seed}:{name}"), args.count)
+        status = f"{mismatches} mismatch(es)" if mismatches else "ok"
+        print(f"{name:8} {status}" + (f" ({note})" if note else ""))
+        failed += bool(mismatches)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+"""
+Importable, side-effect-free core of the CSA scripts.
+
+The menu scripts in the repository root only handle input()/print();
+every conversion lives here and takes values / returns results.
+
+The NumPy batch modules (csa.signed, ...) are not imported here, so the
+menu scripts keep working without NumPy installed.
+"""
+from . import conversions, encoding, fxp, unicode
+
+__all__ = ["conversions", "encoding", "fxp", "unicode"]
@@ -0,0 +1,17 @@
+"""File mapping shared by the modules that stream whole files."""
+import contextlib
+import mmap
+
+
+@contextlib.contextmanager
+def map_file(path):
+    """
+    Maps path read-only and yields the mapping. mmap refuses empty files,
+    so an empty file yields b"" instead.
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
@@ -0,0 +1,76 @@
+"""
+Vectorized N-bit adder (up to 64 bits) with NZVC flags over NumPy arrays.
+
+Same semantics as csa.fxp.add_words / add_binary, for millions of operand
+pairs at once, e.g. to check ALU traces against the reference model.
+"""
+import numpy as np
+
+_ONE = np.uint64(1)
+
+
+def _operand(values, mask: np.uint64) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "ui":
+        raise ValueError("Operands must be integer arrays")
+    return arr.astype(np.uint64, copy=False) & mask
+
+
+def add_batch(num1, num2, incoming_carry, bits: int, code_type: str = "U2"):
+    """
+    Adds arrays of bits-wide words and returns (sum, carries, N, Z, V, C).
+
+    carries holds c_n-1..c0 (bit i is the carry into position i, c0 being
+    incoming_carry); the carry out of the MSB (c_n) is C. incoming_carry is
+    a 0/1 scalar or array. U1 applies the end-around carry like add_binary.
+    """
+    if not 1 <= bits <= 64:
+        raise ValueError("Bit width must be between 1 and 64")
+    if code_type not in ("U1", "U2"):
+        raise ValueError(f"Unsupported code type for addition: {code_type}")
+
+    mask = np.uint64((1 << bits) - 1)
+    top = np.uint64(bits - 1)
+    a = _operand(num1, mask)
+    b = _operand(num2, mask)
+    c0 = _operand(incoming_carry, _ONE)
+
+    # uint64 arithmetic wraps, which only matters for bits == 64: the carry
+    # out is then taken from the majority of a, b and the carry into the MSB.
+    total = a + b + c0
+    carries = a ^ b ^ total
+    C = (((a & b) | ((a ^ b) & carries)) >> top) & _ONE
+
+    final_sum = total & mask
+    if code_type == "U1":
+        final_sum = (final_sum + C) & mask
+
+    N = (final_sum >> top) & _ONE
+    Z = final_sum == 0
+    if code_type == "U2":
+        V = C ^ ((carries >> top) & _ONE)
+    else:
+        # U1 negative zero (all ones) counts as non-negative, as in bin_to_dec
+        neg1 = ((a >> top) & _ONE).astype(bool) & (a != mask)
+        neg2 = ((b >> top) & _ONE).astype(bool) & (b != mask)
+        neg_res = N.astype(bool) & (final_sum != mask)
+        V = (neg1 == neg2) & (neg_res != neg1)
+
+    return (
+        final_sum,
+        carries & mask,
+        N.astype(np.uint8),
+        Z.astype(np.uint8),
+        V.astype(np.uint8),
+        C.astype(np.uint8),
+    )
+
+
+def pack_flags(N, Z, V, C) -> np.ndarray:
+    """Packs flag arrays into one uint8 per row: N=8, Z=4, V=2, C=1."""
+    return (
+        (np.asarray(N, dtype=np.uint8) << 3)
+        | (np.asarray(Z, dtype=np.uint8) << 2)
+        | (np.asarray(V, dtype=np.uint8) << 1)
+        | np.asarray(C, dtype=np.uint8)
+    )
@@ -0,0 +1,17 @@
+"""Bit-counting helpers shared by the NumPy batch modules."""
+import numpy as np
+
+# Number of set bits in every byte value.
+POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(values) -> np.ndarray:
+    """Number of set bits in every element of an integer array, as uint8."""
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "ui":
+        raise ValueError("popcount needs an integer array")
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(arr)
+    arr = np.ascontiguousarray(arr)
+    as_bytes = arr.view(np.uint8).reshape(arr.shape + (arr.dtype.itemsize,))
+    return POPCOUNT8[as_bytes].sum(axis=-1, dtype=np.uint8)
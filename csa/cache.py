@@ -0,0 +1,85 @@
+"""
+Opt-in bounded LRU cache for the pure conversion functions.
+
+    from csa import cache, conversions
+    u2 = cache.cached(conversions.U2_to_decimal, maxsize=4096)
+    u2("11110000")
+    print(cache.stats())
+
+install() does the same for named functions of a menu script or module,
+e.g. cache.install(globals(), ("U2_to_decimal", "hex_to_decimal_U2")).
+
+Only wrap functions with hashable arguments and immutable results (str,
+int, float, tuples of those) - a cached list or array would be shared
+between callers. The default size comes from CSA_CACHE_SIZE (4096).
+"""
+import functools
+import os
+import sys
+
+DEFAULT_MAXSIZE = int(os.environ.get("CSA_CACHE_SIZE", "4096"))
+
+# ("module.function", lru_cache wrapper) for every cached() call, for
+# stats() / clear(); a function wrapped twice has two entries
+_wrappers = []
+
+
+def cached(func, maxsize: int = None):
+    """Returns an LRU-cached version of func and registers it for statistics."""
+    if maxsize is None:
+        maxsize = DEFAULT_MAXSIZE
+    if maxsize < 1:
+        raise ValueError("Cache size must be positive")
+    wrapper = functools.lru_cache(maxsize=maxsize)(func)
+    _wrappers.append((f"{func.__module__}.{func.__qualname__}", wrapper))
+    return wrapper
+
+
+def install(namespace: dict, names, maxsize: int = None):
+    """
+    Replaces each function named in names with its cached version in
+    namespace: a script's globals(), or vars(module) for a script that
+    calls through the module.
+    """
+    for name in names:
+        namespace[name] = cached(namespace[name], maxsize)
+
+
+def stats() -> dict:
+    """
+    Hits, misses, current size, max size and hit rate per cached function.
+    Keys are "module.function", with "#2", "#3" ... appended for a function
+    cached more than once (or lambdas, which share one name).
+    """
+    result = {}
+    for name, wrapper in _wrappers:
+        n = 1
+        key = name
+        while key in result:
+            n += 1
+            key = f"{name}#{n}"
+        info = wrapper.cache_info()
+        calls = info.hits + info.misses
+        result[key] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": info.hits / calls if calls else 0.0,
+        }
+    return result
+
+
+def clear():
+    """Empties every cache and resets its counters."""
+    for _, wrapper in _wrappers:
+        wrapper.cache_clear()
+
+
+def report(file=sys.stderr):
+    for name, s in stats().items():
+        print(
+            f"{name}: {s['hits']} hits, {s['misses']} misses ({s['hit_rate']:.1%}), "
+            f"{s['size']}/{s['maxsize']} entries",
+            file=file,
+        )
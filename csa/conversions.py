@@ -0,0 +1,263 @@
+"""Pure conversion routines behind the Conversions(L2).py menu."""
+from . import profiling, radix
+
+
+def gray_encode(value: int) -> int:
+    return value ^ (value >> 1)
+
+
+def gray_decode(gray: int) -> int:
+    # Prefix XOR of all higher bits in log2(width) shift/XOR steps
+    shift = 1
+    while gray >> shift:
+        gray ^= gray >> shift
+        shift <<= 1
+    return gray
+
+
+def binary_to_gray(binary: str) -> str:
+    binary = binary.strip()
+    if not binary:
+        return ""
+    if binary.strip('01'):
+        raise ValueError("Input must be binary digits only")
+    value = int(binary, 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    gray = gray_encode(value)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return format(gray, f"0{len(binary)}b")
+
+
+def gray_to_binary(gray_code: str) -> str:
+    gray_code = gray_code.strip()
+    if not gray_code:
+        return ""
+    if gray_code.strip('01'):
+        raise ValueError("Input must be binary digits only")
+    gray = int(gray_code, 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    value = gray_decode(gray)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return format(value, f"0{len(gray_code)}b")
+
+
+def base14_to_decimal(number: str) -> float:
+    value = radix.parse(number.upper(), 14)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    result = round(float(value), 3)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def binary_fraction_to_decimal(bin_frac: str) -> float:
+    bin_frac = bin_frac.strip()
+    if '.' not in bin_frac:
+        raise ValueError("Input must contain '.' for fractional part")
+    frac_part = bin_frac.split('.')[1]
+    if frac_part.strip('01'):
+        raise ValueError("Invalid binary digit in fractional part")
+    # Exact value first (all bits as one integer over 2**n), rounded once
+    value = radix.parse_binary("." + frac_part)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    result = round(float(value), 4)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def binary_to_decimal(bin_str: str) -> float:
+    # Integer and fraction bits as one exact value, rounded once. The float
+    # keeps the menu output; radix.to_decimal(radix.parse_binary(s)) is exact.
+    int_part, _, frac_part = bin_str.strip().partition(".")
+    digits = int_part + frac_part
+    if 0 < len(digits) <= 53 and not digits.strip("01"):
+        # up to 53 bits, the integer over 2**n is an exact double
+        value = int(digits, 2) / (1 << len(frac_part))
+    else:
+        value = radix.parse_binary(bin_str)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    result = float(round(value, 4))
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def hex_to_decimal_sign_magnitude(hex_str: str) -> int:
+    hex_str = hex_str.strip()
+    if not hex_str.startswith("#") or len(hex_str) != 4:
+        raise ValueError("Input must be in format '#XYZ' (3 hex digits after #)")
+    num = int(hex_str[1:], 16)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    sign = (num >> 11) & 1  # старший бит — знак
+    magnitude = num & 0x7FF  # 11 бит — величина
+    result = -magnitude if sign == 1 else magnitude
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def hex_to_decimal_U1(hex_str: str) -> int:
+    hex_str = hex_str.strip()
+    if not hex_str.startswith("#") or len(hex_str) != 4:
+        raise ValueError("Input must be in format '#XYZ' (3 hex digits after #)")
+    num = int(hex_str[1:], 16)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    sign = (num >> 11) & 1
+    if sign == 0:
+        result = num
+    else:
+        max_val = (1 << 12) - 1  # 4095 (12 бит)
+        result = -(max_val - num)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def hex_to_decimal_U2(hex_str: str) -> int:
+    hex_str = hex_str.strip()
+    if not hex_str.startswith("#") or len(hex_str) not in (3, 4):
+        raise ValueError("Input must be in format '#XX' or '#XYZ' (2 or 3 hex digits after #)")
+    num = int(hex_str[1:], 16)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    bits = (len(hex_str) - 1) * 4  # количество бит: 2 символа * 4 = 8 бит, 3 символа *4 = 12 бит
+    if num & (1 << (bits - 1)):  # проверка старшего бита
+        num -= (1 << bits)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return num
+
+
+
+def hex_to_decimal(hex_str: str) -> int:
+    hex_str = hex_str.strip()
+    if not hex_str.startswith("#"):
+        raise ValueError("Input must start with '#'")
+    return int(hex_str[1:], 16)
+
+
+def sign_magnitude_to_decimal(bin_str: str) -> int:
+    bin_str = bin_str.strip()
+    if len(bin_str) < 2:
+        raise ValueError("Input binary string too short")
+    if any(c not in '01' for c in bin_str):
+        raise ValueError("Input must be binary digits only")
+    sign = int(bin_str[0])
+    value = int(bin_str[1:], 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    result = -value if sign == 1 else value
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def U1_to_decimal(bin_str: str) -> int:
+    bin_str = bin_str.strip()
+    if len(bin_str) == 0:
+        raise ValueError("Empty input")
+    if any(c not in '01' for c in bin_str):
+        raise ValueError("Input must be binary digits only")
+    value = int(bin_str, 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    if bin_str[0] == '1':
+        # -(inverted bits) = value - (2**n - 1)
+        value -= (1 << len(bin_str)) - 1
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return value
+
+
+def U2_to_decimal(bin_str: str) -> int:
+    bin_str = bin_str.strip()
+    if any(c not in '01' for c in bin_str):
+        raise ValueError("Input must be binary digits only")
+    val = int(bin_str, 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    if bin_str[0] == '1':
+        val -= (1 << len(bin_str))
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return val
+
+
+def detect_gray_code_order_error(codes: list) -> int:
+    for i in range(1, len(codes)):
+        if len(codes[i]) != len(codes[i - 1]):
+            return i + 1
+        diff = sum(a != b for a, b in zip(codes[i], codes[i - 1]))
+        if diff != 1:
+            return i + 1
+    return -1
+
+
+def max_value_11bit() -> float:
+    # Максимальное значение для 11-битного числа с фиксированной точкой (6 бит целая часть, 5 бит дробная)
+    # 6 бит целая часть => max 2^6 - 1 = 63
+    # 5 бит дробная часть => 1 - 2^-5 = 0.96875
+    # Итог: 63 + 0.96875 = 63.96875
+    return 63.96875
+
+
+def min_value_11bit_sign_magnitude() -> float:
+    return -63.96875
+
+
+def min_value_11bit_U1() -> float:
+    return -63.0
+
+
+def biased_to_decimal(bin_str: str) -> int:
+    n = len(bin_str)
+    if any(c not in '01' for c in bin_str):
+        raise ValueError("Input must be binary digits only")
+    bias = (2 ** (n - 1)) - 1
+    val = int(bin_str, 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    result = val - bias
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+def bcd_to_decimal(bcd_str: str) -> int:
+    bcd_str = bcd_str.strip()
+    if not bcd_str:
+        raise ValueError("BCD input must be one or more 4-bit groups, e.g. 00010010")
+    if len(bcd_str) % 4 != 0:
+        raise ValueError("BCD string length must be multiple of 4")
+    if bcd_str.strip('01'):
+        raise ValueError("BCD must contain only binary digits")
+    # Each nibble becomes one hex digit; valid BCD nibbles are exactly 0-9
+    digits = format(int(bcd_str, 2), f"0{len(bcd_str) // 4}x")
+    if not digits.isdigit():
+        i = next(i for i, d in enumerate(digits) if not d.isdigit())
+        raise ValueError(f"Invalid BCD digit: {bcd_str[4 * i:4 * i + 4]}")
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    result = int(digits)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+    return result
+
+
+_BCD_NIBBLES = str.maketrans({str(d): format(d, '04b') for d in range(10)})
+
+
+def decimal_to_bcd(decimal: int) -> str:
+    if decimal < 0:
+        raise ValueError("BCD supports only non-negative integers")
+    return str(decimal).translate(_BCD_NIBBLES)
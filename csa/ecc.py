@@ -0,0 +1,183 @@
+"""
+Hamming(7,4) and SECDED(72,64) error-correcting codes over NumPy arrays.
+
+Both are even-parity Hamming codes: check bit i covers every codeword
+position whose number has bit i set, so the XOR of the stored and the
+recomputed check bits (the syndrome) is the position of a single flipped
+bit. SECDED adds an overall parity bit over all 72 bits, which tells a
+single error (overall parity wrong) from a double one (parity right,
+syndrome non-zero).
+
+Hamming(7,4) codewords are 7-bit ints read as positions 1..7 from the
+top bit down (p1 p2 d1 p4 d2 d3 d4); encode, decode and correction are
+single lookups. SECDED words are a uint64 data array plus a uint8 check
+array: bits 0..6 are the check bits for positions 1, 2, 4 ... 64 and bit
+7 is the overall parity; data bit 0..63 sits at the non-power-of-two
+positions 3..71 in ascending order, as on ECC DIMMs.
+"""
+import numpy as np
+
+from ._io import map_file
+from .parity import PARITY8, word_parity
+
+# decode status per word
+OK = 0
+CORRECTED = 1
+UNCORRECTABLE = 2
+
+
+def _hamming74_encode(nibble: int) -> int:
+    d1, d2, d3, d4 = (nibble >> 3) & 1, (nibble >> 2) & 1, (nibble >> 1) & 1, nibble & 1
+    p1 = d1 ^ d2 ^ d4
+    p2 = d1 ^ d3 ^ d4
+    p4 = d2 ^ d3 ^ d4
+    return p1 << 6 | p2 << 5 | d1 << 4 | p4 << 3 | d2 << 2 | d3 << 1 | d4
+
+
+def _hamming74_syndrome(code: int) -> int:
+    syndrome = 0
+    for position in range(1, 8):
+        if code >> (7 - position) & 1:
+            syndrome ^= position
+    return syndrome
+
+
+def _hamming74_data(code: int) -> int:
+    return (code >> 4 & 1) << 3 | (code >> 2 & 1) << 2 | (code >> 1 & 1) << 1 | code & 1
+
+
+# data nibble -> codeword
+HAMMING74_ENCODE = np.array([_hamming74_encode(d) for d in range(16)], dtype=np.uint8)
+# received codeword -> syndrome (position 1..7 of the flipped bit, 0 if none)
+HAMMING74_SYNDROME = np.array([_hamming74_syndrome(c) for c in range(128)], dtype=np.uint8)
+# received codeword -> data nibble after single-bit correction
+HAMMING74_DECODE = np.array(
+    [_hamming74_data(c ^ (1 << (7 - s) if s else 0)) for c, s in enumerate(HAMMING74_SYNDROME.tolist())],
+    dtype=np.uint8,
+)
+
+
+def hamming74_encode(nibbles) -> np.ndarray:
+    """Data nibbles (0..15) -> 7-bit codewords."""
+    nibbles = np.asarray(nibbles)
+    if nibbles.size and (nibbles.min() < 0 or nibbles.max() > 15):
+        raise ValueError("Hamming(7,4) data must be in 0..15")
+    return HAMMING74_ENCODE[nibbles]
+
+
+def hamming74_decode(codes):
+    """
+    7-bit codewords -> (data nibbles, syndromes). A non-zero syndrome is
+    the position of the bit that was corrected; two flipped bits are
+    beyond this code and decode to the wrong nibble.
+    """
+    codes = np.asarray(codes)
+    if codes.size and (codes.min() < 0 or codes.max() > 127):
+        raise ValueError("Hamming(7,4) codewords must be in 0..127")
+    return HAMMING74_DECODE[codes], HAMMING74_SYNDROME[codes]
+
+
+# SECDED(72,64): codeword position of every data bit.
+_DATA_POSITIONS = [p for p in range(3, 72) if p & (p - 1)]
+# Check bit i covers the data bits whose position has bit i set.
+CHECK_MASKS = np.array(
+    [sum(1 << bit for bit, p in enumerate(_DATA_POSITIONS) if p >> i & 1) for i in range(7)],
+    dtype=np.uint64,
+)
+
+
+def _byte_lane_tables() -> np.ndarray:
+    # lanes[k, b]: the 7 check bits contributed by byte k of the data word
+    # having the value b; the check bits of a word are the XOR over its 8 bytes
+    lanes = np.zeros((8, 256), dtype=np.uint8)
+    for k in range(8):
+        for b in range(256):
+            word = b << (8 * k)
+            lanes[k, b] = sum((bin(word & int(m)).count("1") & 1) << i for i, m in enumerate(CHECK_MASKS))
+    return lanes
+
+
+CHECK_LANES = _byte_lane_tables()
+
+# Syndrome -> data bit to flip (0 when the syndrome points at a check bit).
+SECDED_FLIP = np.array(
+    [1 << _DATA_POSITIONS.index(p) if p in _DATA_POSITIONS else 0 for p in range(128)], dtype=np.uint64
+)
+# Syndromes that name a position inside the 72-bit word.
+_VALID_SYNDROME = np.arange(128) <= 71
+
+
+def _data_words(data) -> np.ndarray:
+    data = np.asarray(data)
+    if data.dtype.kind not in "ui":
+        raise ValueError("SECDED data must be an integer array")
+    return data.astype(np.uint64, copy=False)
+
+
+def _check_bits(data: np.ndarray) -> np.ndarray:
+    lanes = np.ascontiguousarray(data, dtype="<u8").view(np.uint8).reshape(data.shape + (8,))
+    check = CHECK_LANES[0][lanes[..., 0]]
+    for k in range(1, 8):
+        check ^= CHECK_LANES[k][lanes[..., k]]
+    return check
+
+
+def secded_encode(data) -> np.ndarray:
+    """64-bit data words -> their 8 check bits (7 Hamming bits + overall parity in bit 7)."""
+    data = _data_words(data)
+    check = _check_bits(data)
+    overall = word_parity(data) ^ PARITY8[check]
+    return check | (overall << 7)
+
+
+def secded_decode(data, check):
+    """
+    Checks and corrects 64-bit data words against their stored check bytes.
+
+    Returns (corrected data, status) where status is OK, CORRECTED (one
+    flipped bit, in data or check bits) or UNCORRECTABLE (two or more
+    flipped bits; the data is returned as stored).
+    """
+    data = _data_words(data)
+    check = np.asarray(check, dtype=np.uint8)
+    if data.shape != check.shape:
+        raise ValueError("Data and check arrays must have the same shape")
+    syndrome = _check_bits(data) ^ (check & 0x7F)
+    # parity over all 72 stored bits: 0 for a clean word or a double error
+    overall = word_parity(data) ^ PARITY8[check]
+
+    single = (overall == 1) & _VALID_SYNDROME[syndrome]
+    corrected = np.where(single, data ^ SECDED_FLIP[syndrome], data)
+    status = np.full(data.shape, OK, dtype=np.uint8)
+    status[single] = CORRECTED
+    status[(syndrome != 0) & ~single] = UNCORRECTABLE
+    return corrected, status
+
+
+def scrub(buf):
+    """
+    SECDED over a RAM image of 9-byte records (8 little-endian data bytes,
+    then the check byte). Returns (corrected data, status) per record.
+    """
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    if raw.size % 9:
+        raise ValueError("Image length is not a multiple of 9 bytes")
+    records = raw.reshape(-1, 9)
+    data = np.ascontiguousarray(records[:, :8]).view("<u8").ravel()
+    return secded_decode(data, records[:, 8])
+
+
+def scrub_file(path, chunk_records: int = 1 << 22):
+    """
+    scrub() over a file, mapped into memory and processed chunk_records at
+    a time. Returns the indices of the corrected and the uncorrectable words.
+    """
+    corrected, failed = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    with map_file(path) as mm:
+        if len(mm) % 9:
+            raise ValueError("Image length is not a multiple of 9 bytes")
+        for first in range(0, len(mm) // 9, chunk_records):
+            _, status = scrub(mm[first * 9:(first + chunk_records) * 9])
+            corrected.append(np.flatnonzero(status == CORRECTED) + first)
+            failed.append(np.flatnonzero(status == UNCORRECTABLE) + first)
+    return np.concatenate(corrected), np.concatenate(failed)
@@ -0,0 +1,36 @@
+"""Pure versions of the Encoding(L1).py tasks."""
+import math
+
+
+def binary_to_decimal(binary_str: str) -> int:
+    return int(binary_str.strip(), 2)
+
+
+def binary_to_hex(binary_str: str) -> str:
+    return hex(int(binary_str.strip().replace(" ", ""), 2))[2:].upper()
+
+
+def min_bits_needed(min_val: int, max_val: int) -> int:
+    return math.ceil(math.log2(max_val - min_val + 1))
+
+
+def hex_to_binary(hex_str: str) -> str:
+    return bin(int(hex_str.strip(), 16))[2:]
+
+
+def even_parity_bit(binary_str: str) -> str:
+    total_ones = binary_str.strip().replace(" ", "").count("1")
+    return '0' if total_ones % 2 == 0 else '1'
+
+
+def odd_parity_bit(binary_str: str) -> str:
+    total_ones = binary_str.strip().replace(" ", "").count("1")
+    return '1' if total_ones % 2 == 0 else '0'
+
+
+def hex_to_decimal(hex_str: str) -> int:
+    return int(hex_str.strip(), 16)
+
+
+def bits_needed_for_states(states: str) -> int:
+    return math.ceil(math.log2(len(states.strip().split(","))))
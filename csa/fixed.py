@@ -0,0 +1,92 @@
+"""
+Configurable Qm.n fixed-point codec (SM, U1, U2, biased) over NumPy arrays.
+
+A Qm.n word has one sign bit, m integer bits and n fraction bits, so the
+menu's "6.5" format (options 13-17) is Q6.5 in a 12-bit word: max 63.96875.
+Values are quantized to integers k = value * 2**n and stored as raw words
+in the chosen code; dequantize() decodes them back through csa.signed.
+Rounding follows csa.qformat, so quantize() and fxalu.to_fixed agree.
+"""
+from fractions import Fraction
+
+import numpy as np
+
+from . import signed
+from .qformat import check_rounding, round_float, word_bits
+
+# Words are stored in int64 / uint64; one bit is left for the sign of k.
+MAX_BITS = 63
+
+
+def int_range(int_bits: int, frac_bits: int, code_type: str = "U2"):
+    """(min, max) of the scaled integer k = value * 2**frac_bits."""
+    top = 1 << (word_bits(int_bits, frac_bits, MAX_BITS) - 1)
+    if code_type == "U2":
+        return -top, top - 1
+    if code_type in ("U1", "SM"):
+        return -(top - 1), top - 1
+    if code_type == "biased":
+        # bias = 2^(w-1) - 1, as in biased_to_decimal
+        return -(top - 1), top
+    raise ValueError(f"Unsupported code type: {code_type}")
+
+
+def value_range(int_bits: int, frac_bits: int, code_type: str = "U2"):
+    """(min, max) representable values as exact Fractions."""
+    low, high = int_range(int_bits, frac_bits, code_type)
+    scale = 1 << frac_bits
+    return Fraction(low, scale), Fraction(high, scale)
+
+
+def encode_ints(k, bits: int, code_type: str = "U2") -> np.ndarray:
+    """Scaled integers (already in range) -> raw bits-wide words as uint64."""
+    k = np.asarray(k, dtype=np.int64)
+    mask = np.uint64((1 << bits) - 1)
+    if code_type == "U2":
+        return k.astype(np.uint64) & mask
+    if code_type == "U1":
+        return np.where(k < 0, mask - (-k).astype(np.uint64), k.astype(np.uint64))
+    if code_type == "SM":
+        sign = (k < 0).astype(np.uint64) << np.uint64(bits - 1)
+        return np.abs(k).astype(np.uint64) | sign
+    if code_type == "biased":
+        return (k + np.int64((1 << (bits - 1)) - 1)).astype(np.uint64)
+    raise ValueError(f"Unsupported code type: {code_type}")
+
+
+def quantize(values, int_bits: int, frac_bits: int, code_type: str = "U2",
+             rounding: str = "nearest", saturate: bool = True) -> np.ndarray:
+    """
+    Float array -> raw Qm.n words (uint64).
+
+    Out-of-range values are clamped to the format limits when saturate is
+    True. Otherwise they wrap modulo 2**bits, which is only defined for
+    U2 and biased; SM and U1 raise ValueError.
+    """
+    bits = word_bits(int_bits, frac_bits, MAX_BITS)
+    low, high = int_range(int_bits, frac_bits, code_type)
+    check_rounding(rounding)
+    scaled = np.asarray(values, dtype=np.float64) * float(1 << frac_bits)
+    if np.isnan(scaled).any():
+        raise ValueError("Cannot quantize NaN")
+    if not saturate:
+        if code_type not in ("U2", "biased"):
+            raise ValueError(f"Wrapping is not defined for {code_type}; use saturate=True")
+        if (np.abs(scaled) >= 2.0 ** 63).any():
+            raise ValueError("Value too large to wrap")
+    # beyond 2**63 every value saturates anyway; keeps infinities out of round_float
+    rounded = round_float(np.clip(scaled, -2.0 ** 63, 2.0 ** 63), rounding, np.floor)
+
+    if saturate:
+        # float(high) rounds up past 53 bits, so clamp again as integers
+        k = np.clip(np.clip(rounded, low, high).astype(np.int64), low, high)
+    else:
+        k = rounded.astype(np.int64)
+        # reduce into [low, high] modulo 2**bits
+        k = ((k - low) & np.int64((1 << bits) - 1)) + low
+    return encode_ints(k, bits, code_type)
+
+
+def dequantize(words, int_bits: int, frac_bits: int, code_type: str = "U2") -> np.ndarray:
+    """Raw Qm.n words -> float64 values."""
+    return signed.fixed_to_float(words, word_bits(int_bits, frac_bits, MAX_BITS), frac_bits, code_type)
@@ -0,0 +1,125 @@
+"""
+Fixed-point ALU model for U2 Qm.n words (sign + m integer + n fraction bits).
+
+Operands and results are the scaled integers k = value * 2**n held as
+plain ints, not bit strings; to_fixed / from_fixed convert exactly. Every
+operation returns (result, N, Z, V, C). V is set whenever the exact
+result does not fit the format; the result is then clamped to the format
+limits (saturate=True) or wrapped modulo 2**bits like the hardware would.
+
+    add, sub   through fxp.add_words; C is the adder carry out (for sub,
+               1 means no borrow, as a + ~b + 1)
+    mul        full-width product, rescaled by 2**n with the chosen rounding
+    div        (a * 2**n) / b with the chosen rounding; dividing by zero
+               sets V and returns the limit with the dividend's sign
+    shl, shr   arithmetic shifts by b bits; C is the last bit shifted out
+
+csa.fxbatch runs the same operations over NumPy arrays. Word widths and
+rounding come from csa.qformat.
+"""
+from fractions import Fraction
+
+from .fxp import add_words
+from .qformat import div_round, limits, word_bits
+
+OPS = ("add", "sub", "mul", "div", "shl", "shr")
+
+
+def to_fixed(value, frac_bits: int, rounding: str = "nearest") -> int:
+    """Number (int, float, Fraction or decimal string) -> scaled integer, exactly rounded."""
+    exact = Fraction(value) * (1 << frac_bits)
+    return div_round(exact.numerator, exact.denominator, rounding)
+
+
+def from_fixed(k: int, frac_bits: int) -> Fraction:
+    return Fraction(k, 1 << frac_bits)
+
+
+def _check(k: int, bits: int):
+    low, high = limits(bits)
+    if not low <= k <= high:
+        raise ValueError(f"Operand {k} does not fit a {bits}-bit word")
+
+
+def _finish(exact: int, bits: int, saturate: bool, C: int = 0):
+    """Fits an exact result into the word and derives the flags."""
+    low, high = limits(bits)
+    V = 0 if low <= exact <= high else 1
+    if not V:
+        result = exact
+    elif saturate:
+        result = high if exact > high else low
+    else:
+        result = ((exact - low) & ((1 << bits) - 1)) + low
+    return result, 1 if result < 0 else 0, 1 if result == 0 else 0, V, C
+
+
+def _add(a: int, b: int, carry_in: int, bits: int, saturate: bool):
+    mask = (1 << bits) - 1
+    C = add_words(a & mask, b & mask, carry_in, bits, "U2")[5]
+    # the adder's V is exactly the range check _finish does on the true sum
+    return _finish(a + b + carry_in, bits, saturate, C)
+
+
+def add(a: int, b: int, int_bits: int, frac_bits: int, saturate: bool = True):
+    bits = word_bits(int_bits, frac_bits)
+    _check(a, bits)
+    _check(b, bits)
+    return _add(a, b, 0, bits, saturate)
+
+
+def sub(a: int, b: int, int_bits: int, frac_bits: int, saturate: bool = True):
+    bits = word_bits(int_bits, frac_bits)
+    _check(a, bits)
+    _check(b, bits)
+    # a + ~b + 1: ~b is -b - 1 as a U2 value
+    return _add(a, -b - 1, 1, bits, saturate)
+
+
+def mul(a: int, b: int, int_bits: int, frac_bits: int, saturate: bool = True, rounding: str = "trunc"):
+    bits = word_bits(int_bits, frac_bits)
+    _check(a, bits)
+    _check(b, bits)
+    return _finish(div_round(a * b, 1 << frac_bits, rounding), bits, saturate)
+
+
+def div(a: int, b: int, int_bits: int, frac_bits: int, saturate: bool = True, rounding: str = "trunc"):
+    bits = word_bits(int_bits, frac_bits)
+    _check(a, bits)
+    _check(b, bits)
+    if b == 0:
+        low, high = limits(bits)
+        result = low if a < 0 else high
+        return result, 1 if result < 0 else 0, 1 if result == 0 else 0, 1, 0
+    return _finish(div_round(a << frac_bits, b, rounding), bits, saturate)
+
+
+def shl(a: int, count: int, int_bits: int, frac_bits: int, saturate: bool = True):
+    bits = word_bits(int_bits, frac_bits)
+    _check(a, bits)
+    if count < 0:
+        raise ValueError("Shift count must be non-negative")
+    C = ((a & ((1 << bits) - 1)) >> (bits - count)) & 1 if 0 < count <= bits else 0
+    return _finish(a << count, bits, saturate, C)
+
+
+def shr(a: int, count: int, int_bits: int, frac_bits: int, saturate: bool = True):
+    bits = word_bits(int_bits, frac_bits)
+    _check(a, bits)
+    if count < 0:
+        raise ValueError("Shift count must be non-negative")
+    C = (a >> (count - 1)) & 1 if count else 0
+    return _finish(a >> count, bits, saturate, C)
+
+
+_OPS = {"add": add, "sub": sub, "mul": mul, "div": div, "shl": shl, "shr": shr}
+
+
+def execute(op: str, a: int, b: int, int_bits: int, frac_bits: int, saturate: bool = True, rounding: str = "trunc"):
+    """Runs one operation by name; rounding applies to mul and div only."""
+    func = _OPS.get(op)
+    if func is None:
+        raise ValueError(f"Unsupported operation: {op}")
+    if op in ("mul", "div"):
+        return func(a, b, int_bits, frac_bits, saturate, rounding)
+    return func(a, b, int_bits, frac_bits, saturate)
@@ -0,0 +1,81 @@
+"""
+csa.fxalu operations over NumPy arrays of Qm.n scaled integers.
+
+execute() runs one operation over whole operand arrays and returns
+exactly what fxalu.execute would give per element. Add and sub take
+their carry from alu.add_batch; mul and div round with qformat.div_round.
+"""
+import numpy as np
+
+from .alu import add_batch
+from .fxalu import OPS
+from .qformat import check_rounding, div_round, limits, word_bits
+
+# Products and shifted dividends of 32-bit words still fit in int64.
+MAX_BITS = 32
+
+
+def execute(op: str, a, b, int_bits: int, frac_bits: int, saturate: bool = True, rounding: str = "trunc"):
+    """
+    Runs one csa.fxalu operation over arrays of scaled integers and returns
+    (result, N, Z, V, C): int64 results and uint8 flags. Words are at most
+    32 bits.
+    """
+    if op not in OPS:
+        raise ValueError(f"Unsupported operation: {op}")
+    check_rounding(rounding)
+    bits = word_bits(int_bits, frac_bits, MAX_BITS)
+    low, high = limits(bits)
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    if a.size and (a.min() < low or a.max() > high):
+        raise ValueError(f"Operands do not fit a {bits}-bit word")
+    mask = np.int64((1 << bits) - 1)
+    C = np.zeros(np.broadcast(a, b).shape, dtype=np.uint8)
+    by_zero = None
+
+    if op in ("add", "sub", "mul", "div"):
+        if b.size and (b.min() < low or b.max() > high):
+            raise ValueError(f"Operands do not fit a {bits}-bit word")
+    elif b.size and b.min() < 0:
+        raise ValueError("Shift count must be non-negative")
+
+    if op == "add":
+        C = add_batch(a & mask, b & mask, 0, bits)[5]
+        exact = a + b
+    elif op == "sub":
+        C = add_batch(a & mask, ~b & mask, 1, bits)[5]
+        exact = a - b
+    elif op == "mul":
+        exact = div_round(a * b, np.int64(1 << frac_bits), rounding)
+    elif op == "div":
+        by_zero = b == 0
+        exact = div_round(a << np.int64(frac_bits), np.where(by_zero, 1, b), rounding)
+    elif op == "shl":
+        # a nonzero word shifted by bits or more always overflows and wraps
+        # to 0, so clamping the count keeps the product inside int64
+        count = np.minimum(b, bits)
+        out = ((a & mask) >> (bits - count)) & 1
+        C = np.where((b > 0) & (b <= bits), out, 0).astype(np.uint8)
+        exact = a << count
+    else:
+        count = np.minimum(b, 63)
+        C = np.where(b > 0, (a >> np.maximum(count - 1, 0)) & 1, 0).astype(np.uint8)
+        exact = a >> count
+
+    V = (exact < low) | (exact > high)
+    if saturate:
+        result = np.clip(exact, low, high)
+    else:
+        result = ((exact - low) & mask) + low
+    if by_zero is not None:
+        # dividing by zero reports V and the limit with the dividend's sign
+        result = np.where(by_zero, np.where(a < 0, low, high), result)
+        V = V | by_zero
+    return (
+        result,
+        (result < 0).astype(np.uint8),
+        (result == 0).astype(np.uint8),
+        V.astype(np.uint8),
+        C,
+    )
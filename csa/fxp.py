@@ -0,0 +1,235 @@
+"""Pure U1/U2/SM arithmetic behind the FXP-SIMPLE.py menu."""
+from . import profiling
+
+
+def bin_to_dec(binary_str, bits, code_type="U2"):
+    """
+    Converts a binary string to its decimal equivalent based on the specified code type.
+    """
+    if not binary_str:
+        return 0
+
+    if code_type == "U2":
+        if binary_str[0] == '1':  # Negative number in U2
+            return int(binary_str, 2) - (1 << bits)
+        else:  # Positive number
+            return int(binary_str, 2)
+    elif code_type == "SM":
+        if binary_str[0] == '1':  # Negative number in Sign-Magnitude
+            return -int(binary_str[1:], 2)
+        else:  # Positive number
+            return int(binary_str[1:], 2)
+    elif code_type == "U1":
+        if binary_str[0] == '1':  # Negative number in One's Complement
+            # Invert and convert to decimal, then negate
+            # Note: For -0 (11...1), this would result in +0 (00...0).
+            inverted_magnitude = ''.join(['1' if bit == '0' else '0' for bit in binary_str[1:]])
+            return -int(inverted_magnitude, 2)
+        else:  # Positive number
+            return int(binary_str, 2)
+    return None 
+
+def dec_to_bin(decimal_val, bits, code_type="U2"):
+    """
+    Converts a decimal number to its binary string representation (U2/SM/U1).
+    """
+    if decimal_val >= 0:
+        return bin(decimal_val)[2:].zfill(bits)
+    else:
+        if code_type == "U2":
+            # For negative U2, add to 2^bits and convert
+            return bin((1 << bits) + decimal_val)[2:].zfill(bits)
+        elif code_type == "SM":
+            sign_bit = '1'
+            magnitude = abs(decimal_val)
+            # Ensure magnitude is (bits - 1) long
+            return sign_bit + bin(magnitude)[2:].zfill(bits - 1)
+        elif code_type == "U1":
+            # Convert absolute value to binary, then invert for magnitude
+            pos_val_bin = bin(abs(decimal_val))[2:].zfill(bits - 1)
+            inverted_magnitude = ''.join(['1' if bit == '0' else '0' for bit in pos_val_bin])
+            return '1' + inverted_magnitude
+    return None
+
+def sign_extend(binary_str, target_bits, code_type):
+    """
+    Sign-extends a binary number to target_bits based on the code type.
+    For U1/U2, repeats the sign bit. For SM, pads magnitude with zeros.
+    """
+    current_bits = len(binary_str)
+    if current_bits >= target_bits:
+        # If current bits are already target_bits or more, return as is.
+        # This implies no extension is needed or truncation for larger inputs (handled elsewhere if required).
+        return binary_str 
+
+    sign_bit = binary_str[0]
+    extension_amount = target_bits - current_bits
+
+    if code_type == "SM":
+        # For Sign-Magnitude, the magnitude is zero-extended.
+        # Sign bit remains, then zero-pad the magnitude part.
+        return sign_bit + binary_str[1:].zfill(target_bits - 1)
+    elif code_type in ["U1", "U2"]:
+        # For One's and Two's Complement, repeat the sign bit.
+        return sign_bit * extension_amount + binary_str
+    else:
+        raise ValueError(f"Unsupported code type for sign extension: {code_type}")
+
+
+def add_words(num1, num2, incoming_carry, bits, code_type="U2"):
+    """
+    Adds two bits-wide words held as ints and returns sum, carries and NZVC.
+    The carries int holds c_n..c0 (bit i is the carry into position i), so
+    it is found with one XOR instead of a bit-by-bit ripple loop.
+    """
+    mask = (1 << bits) - 1
+    msb = 1 << (bits - 1)
+    total = num1 + num2 + incoming_carry
+
+    # a ^ b ^ (a + b + c0) leaves exactly the carry into every position,
+    # c0 at bit 0 and the carry out of the MSB (c_n) at bit n.
+    carries = num1 ^ num2 ^ total
+    C = (carries >> bits) & 1
+
+    final_sum = total & mask
+    if code_type == "U1" and C == 1:
+        # End-around carry
+        final_sum = (final_sum + 1) & mask
+
+    N = 1 if final_sum & msb else 0
+    Z = 1 if final_sum == 0 else 0
+
+    V = 0
+    if code_type == "U2":
+        # V = c_n XOR c_n-1
+        V = C ^ ((carries >> (bits - 1)) & 1)
+    elif code_type == "U1":
+        # Same-sign operands, result of the other sign. As in bin_to_dec,
+        # U1 negative zero (all ones) counts as non-negative.
+        neg1 = bool(num1 & msb) and num1 != mask
+        neg2 = bool(num2 & msb) and num2 != mask
+        neg_res = bool(final_sum & msb) and final_sum != mask
+        if neg1 == neg2 and neg_res != neg1:
+            V = 1
+
+    return final_sum, carries, N, Z, V, C
+
+
+def add_binary(num1_str, num2_str, incoming_carry, code_type="U2"):
+    """
+    Performs binary addition and returns sum, carry bits, and NZVC conditions.
+    Code_type specifies the representation for NZVC calculation.
+    Handles different lengths by sign-extending.
+    """
+    # Determine the effective number of bits for the operation.
+    # This should be the length of the longest input number *after* potential padding
+    max_len = max(len(num1_str), len(num2_str))
+
+    # Apply sign extension if numbers have different lengths
+    num1_str_extended = sign_extend(num1_str, max_len, code_type)
+    num2_str_extended = sign_extend(num2_str, max_len, code_type)
+
+    bits = max_len
+    num1 = int(num1_str_extended, 2)
+    num2 = int(num2_str_extended, 2)
+    if profiling.ENABLED:
+        profiling.lap("parse")
+    final_sum, carries, N, Z, V, C = add_words(num1, num2, int(incoming_carry), bits, code_type)
+    if profiling.ENABLED:
+        profiling.lap("compute")
+
+    # Carries are returned from c_n down to c0, i.e. bits + 1 characters.
+    return format(final_sum, f"0{bits}b"), format(carries, f"0{bits + 1}b"), N, Z, V, C
+
+def negate_sm(binary_str):
+    """Negates a number in Sign-Magnitude code."""
+    if not binary_str:
+        return ""
+    # Simply flip the sign bit
+    negated_str = '1' if binary_str[0] == '0' else '0'
+    negated_str += binary_str[1:]
+    return negated_str
+
+def negate_u1(binary_str):
+    """Negates a number in U1 (One's Complement) code and determines NZVC."""
+    bits = len(binary_str)
+    
+    # Negation in U1 is simply inverting all bits
+    negated_val_bin = ''.join(['1' if bit == '0' else '0' for bit in binary_str])
+    
+    # Determine NZVC conditions for negation in U1
+    N = int(negated_val_bin[0]) # N is 1 if MSB of result is 1
+    Z = 1 if int(negated_val_bin, 2) == 0 else 0 # Z is 1 if result is zero
+    
+    # Overflow (V) for U1 negation: Generally, not defined in the same way as U2.
+    # If the input is '11...1' (negative zero) and it negates to '00...0' (positive zero),
+    # there isn't typically an overflow condition, though the existence of two zeros is a property.
+    # For a general negation operation, V is often 0 unless specific rules state otherwise.
+    V = 0 
+    
+    # Carry (C) for U1 negation: Not directly applicable as a carry from an adder.
+    C = 0 
+    
+    return negated_val_bin, N, Z, V, C
+
+def negate_u2(binary_str):
+    """Negates a number in U2 (Two's Complement) code and determines NZVC."""
+    bits = len(binary_str)
+    
+    # Handle the special case of the most negative number (-2^(bits-1))
+    # E.g., for 8-bit, 10000000 (-128). Its negation (+128) cannot be represented.
+    if binary_str[0] == '1' and binary_str[1:] == '0' * (bits - 1):
+        negated_val_bin = binary_str # Remains itself, or is an error condition
+        
+        N = 1 # Still negative
+        Z = 0 # Not zero
+        V = 1 # Overflow occurs because positive equivalent is out of range
+        C = 0 # No carry out for standard negation interpretation
+        
+        return negated_val_bin, N, Z, V, C
+
+    # 1. Invert all bits (One's Complement)
+    inverted_bits = ''.join(['1' if bit == '0' else '0' for bit in binary_str])
+    
+    # 2. Add 1 to the result (mimic add_binary for this specific addition)
+    # We convert to int, add 1, then convert back to binary string of correct length
+    temp_sum = int(inverted_bits, 2) + 1
+    negated_val_bin = bin(temp_sum)[2:].zfill(bits)
+    
+    # If adding 1 results in an extra bit (e.g., 0111 (+7) becomes 1000 (-8)),
+    # this extra bit is implicitly truncated for U2 negation.
+    if len(negated_val_bin) > bits:
+        negated_val_bin = negated_val_bin[-bits:] 
+
+    # Determine NZVC conditions for general negation in U2
+    N = int(negated_val_bin[0]) # N: Sign of the result
+    Z = 1 if int(negated_val_bin, 2) == 0 else 0 # Z: Is result zero?
+    V = 0 # V: For all other cases besides the most negative number, V=0.
+    C = 0 # C: Carry flag for negation is typically 0.
+    
+    return negated_val_bin, N, Z, V, C
+
+def extend_sm(binary_str, target_bits):
+    """Extends a Sign-Magnitude binary number to target_bits."""
+    current_bits = len(binary_str)
+    if current_bits > target_bits:
+        raise ValueError("Target bits less than current bits.")
+    
+    sign_bit = binary_str[0]
+    magnitude = binary_str[1:]
+    
+    # For Sign-Magnitude, the magnitude is zero-extended.
+    extended_magnitude = magnitude.zfill(target_bits - 1) 
+    return sign_bit + extended_magnitude
+
+def extend_u(binary_str, target_bits):
+    """Extends a U1 (One's Complement) or U2 (Two's Complement) binary number to target_bits."""
+    current_bits = len(binary_str)
+    if current_bits > target_bits:
+        raise ValueError("Target bits less than current bits.")
+    
+    sign_bit = binary_str[0]
+    
+    # For U1/U2, extend by repeating the sign bit (sign extension).
+    extension_bits = sign_bit * (target_bits - current_bits)
+    return extension_bits + binary_str
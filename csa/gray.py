@@ -0,0 +1,124 @@
+"""
+Gray code encode/decode over NumPy arrays.
+
+Array counterparts of conversions.gray_encode / gray_decode. Encoding is
+g = b ^ (b >> 1); decoding is the prefix XOR of all higher bits, done with
+log2(width) shift/XOR passes instead of one pass per bit. For 8/16-bit
+samples a precomputed lookup table (decode_lut) is a single gather.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .bitops import popcount
+
+
+def _unsigned(values) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype.kind != "u":
+        if arr.dtype.kind != "i":
+            raise ValueError("Gray codes must be an integer array")
+        if arr.size and arr.min() < 0:
+            raise ValueError("Gray codes must be non-negative")
+        arr = arr.astype(np.dtype(f"u{arr.dtype.itemsize}"))
+    return arr
+
+
+def encode(values) -> np.ndarray:
+    """Binary -> Gray for every element of an unsigned array."""
+    arr = _unsigned(values)
+    return arr ^ (arr >> arr.dtype.type(1))
+
+
+def decode(codes) -> np.ndarray:
+    """Gray -> binary for every element; 3 to 6 shift/XOR passes depending on the dtype."""
+    arr = _unsigned(codes).copy()
+    shift = 1
+    while shift < arr.dtype.itemsize * 8:
+        arr ^= arr >> arr.dtype.type(shift)
+        shift <<= 1
+    return arr
+
+
+def _check_table_bits(bits: int):
+    if bits not in (8, 16):
+        raise ValueError("Lookup tables are only built for 8 and 16 bits")
+
+
+@lru_cache(maxsize=None)
+def encode_table(bits: int) -> np.ndarray:
+    """Binary -> Gray table for all 2**bits values (bits is 8 or 16)."""
+    _check_table_bits(bits)
+    table = encode(np.arange(1 << bits, dtype=np.dtype(f"u{bits // 8}")))
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=None)
+def decode_table(bits: int) -> np.ndarray:
+    """Gray -> binary table for all 2**bits codes (bits is 8 or 16)."""
+    _check_table_bits(bits)
+    table = decode(np.arange(1 << bits, dtype=np.dtype(f"u{bits // 8}")))
+    table.flags.writeable = False
+    return table
+
+
+def decode_lut(codes, bits: int = 16) -> np.ndarray:
+    """Decodes codes that fit in bits (8 or 16) with one table gather."""
+    arr = _unsigned(codes)
+    if arr.size and int(arr.max()) >> bits:
+        raise ValueError(f"Gray code does not fit in {bits} bits")
+    return decode_table(bits)[arr]
+
+
+def sequence_errors(samples, allow_repeats: bool = False, previous=None) -> np.ndarray:
+    """
+    Indices i where samples[i] is not one bit away from samples[i - 1].
+
+    Unlike detect_gray_code_order_error this returns every violation and
+    uses 0-based indices. previous is the sample before samples[0] (when
+    validating a stream chunk by chunk); without it index 0 is never flagged.
+    """
+    arr = _unsigned(samples)
+    if previous is not None:
+        arr = np.concatenate((np.array([previous], dtype=arr.dtype), arr))
+    if arr.size < 2:
+        return np.empty(0, dtype=np.int64)
+    distance = popcount(arr[1:] ^ arr[:-1])
+    bad = distance > 1 if allow_repeats else distance != 1
+    indices = np.flatnonzero(bad)
+    return indices if previous is not None else indices + 1
+
+
+def window_error_counts(errors, total: int, window: int) -> np.ndarray:
+    """Number of violations in each window of samples [k*window, (k+1)*window)."""
+    if window < 1:
+        raise ValueError("window must be positive")
+    return np.bincount(np.asarray(errors) // window, minlength=-(-total // window))
+
+
+def validate_file(path, dtype="<u2", chunk_samples: int = 1 << 22, window: int = None, allow_repeats: bool = False):
+    """
+    Validates a raw capture of Gray-coded samples in one streaming pass.
+
+    Reads chunk_samples at a time, carries the last sample of each chunk
+    into the next so no transition is missed, and returns (errors, counts):
+    all violation indices and, if window is given, per-window error counts.
+    """
+    dtype = np.dtype(dtype)
+    found = []
+    total = 0
+    previous = None
+    with open(path, "rb") as f:
+        while True:
+            chunk = np.fromfile(f, dtype=dtype, count=chunk_samples)
+            if not chunk.size:
+                break
+            errors = sequence_errors(chunk, allow_repeats, previous)
+            if errors.size:
+                found.append(errors + total)
+            total += chunk.size
+            previous = chunk[-1]
+    errors = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+    counts = window_error_counts(errors, total, window) if window else None
+    return errors, counts
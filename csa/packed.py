@@ -0,0 +1,100 @@
+"""
+Unpacks bit streams of packed sub-byte / odd-width samples (10, 12, 24 ...).
+
+Samples of 1..32 bits are packed back to back, MSB first, as a 12-bit ADC
+or a #XYZ word stream would be. Eight samples always span exactly `bits`
+bytes, so sample j of every group sits at the same byte offset and bit
+shift: it is read for all groups at once through a strided big-endian view
+of the buffer (np.frombuffer, no copy), then shifted and masked. The raw
+words then go through csa.signed, so "U2", "U1", "SM" and "biased" mean
+exactly what they do in hex_to_decimal_U2 & co.
+
+unpack_file maps the file and yields one chunk of samples at a time, so
+files larger than memory stream through.
+"""
+import numpy as np
+
+from . import signed
+from ._io import map_file
+
+MAX_BITS = 32
+DEFAULT_CHUNK_SAMPLES = 1 << 22
+
+
+def _check_bits(bits: int):
+    if not 1 <= bits <= MAX_BITS:
+        raise ValueError(f"Sample width must be between 1 and {MAX_BITS} bits")
+
+
+def _unpack_groups(raw: np.ndarray, groups: int, bits: int) -> np.ndarray:
+    """
+    Samples of the first `groups` 8-sample groups of raw. Sample j of every
+    group is read as one big-endian 4- or 8-byte word through a strided view
+    (stride = group size, no copy) and shifted into place. raw must extend
+    at least 8 bytes past the last group.
+    """
+    width = 4 if bits <= 25 else 8  # a sample spans at most 4 (5) bytes
+    mask = (1 << bits) - 1
+    out = np.empty((groups, 8), dtype=np.uint32)
+    if not groups:
+        return out.ravel()
+    for j in range(8):
+        first = j * bits // 8
+        view = np.ndarray((groups,), dtype=f">u{width}", buffer=raw, offset=first, strides=(bits,))
+        shift = 8 * width - ((j + 1) * bits - 8 * first)
+        np.bitwise_and(view >> shift, mask, out=out[:, j], casting="unsafe")
+    return out.ravel()
+
+
+def unpack_raw(buf, bits: int, count: int = None) -> np.ndarray:
+    """
+    First count (default: all whole) bits-wide samples of buf as uint32 raw
+    words. Bits after the last whole sample are ignored.
+    """
+    _check_bits(bits)
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    available = raw.size * 8 // bits
+    if count is None:
+        count = available
+    elif count > available:
+        raise ValueError(f"Buffer holds only {available} {bits}-bit samples")
+    groups = (count + 7) // 8
+    # groups whose reads stay inside buf are viewed in place; the last few
+    # are copied into a zero-padded scratch buffer
+    direct = max(min(groups, (raw.size - 8) // bits), 0)
+    parts = [_unpack_groups(raw, direct, bits)]
+    if direct < groups:
+        tail = np.zeros((groups - direct) * bits + 8, dtype=np.uint8)
+        rest = raw[direct * bits:groups * bits]
+        tail[:rest.size] = rest
+        parts.append(_unpack_groups(tail, groups - direct, bits))
+    return np.concatenate(parts)[:count] if len(parts) > 1 else parts[0][:count]
+
+
+def unpack(buf, bits: int, code_type: str = "U2", count: int = None) -> np.ndarray:
+    """Packed samples -> int64 values decoded as code_type (see csa.signed.CODE_TYPES)."""
+    return signed.decode(unpack_raw(buf, bits, count), bits, code_type)
+
+
+def unpack_file(path, bits: int, code_type: str = "U2", chunk_samples: int = DEFAULT_CHUNK_SAMPLES):
+    """
+    Yields the decoded samples of a packed file chunk by chunk (int64
+    arrays, chunk_samples rounded down to a multiple of 8 per chunk).
+    code_type None yields the raw uint32 words instead.
+    """
+    _check_bits(bits)
+    if code_type is not None and code_type not in signed.CODE_TYPES:
+        raise ValueError(f"Unsupported code type: {code_type}")
+    group_samples = max(chunk_samples // 8, 1)
+    with map_file(path) as mm:
+        size = len(mm)
+        total = size * 8 // bits
+        for first in range(0, total, group_samples * 8):
+            count = min(group_samples * 8, total - first)
+            start = first * bits // 8
+            # 8 bytes of slack let the last groups be read in place too
+            length = min((count * bits + 7) // 8 + 8, size - start)
+            view = np.frombuffer(mm, dtype=np.uint8, count=length, offset=start)
+            words = unpack_raw(view, bits, count)
+            del view  # the mapping cannot close while a view is alive
+            yield words if code_type is None else signed.decode(words, bits, code_type)
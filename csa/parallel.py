@@ -0,0 +1,107 @@
+"""
+Multi-core batch runner for newline-delimited conversion jobs.
+
+The input file is cut into byte ranges whose edges are moved forward to
+the next newline, so every record lands in exactly one chunk. Each worker
+process opens the file itself, converts its range line by line and sends
+back the joined output; results are written in input order.
+
+    python -m csa.parallel conversions.U2_to_decimal words.txt -w 32 > out.txt
+"""
+import argparse
+import importlib
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 8 << 20
+
+
+def resolve(task: str):
+    """'conversions.U2_to_decimal' -> the function csa.conversions.U2_to_decimal."""
+    module_name, _, func_name = task.rpartition(".")
+    if not module_name:
+        raise ValueError("Task must look like 'module.function', e.g. 'conversions.U2_to_decimal'")
+    try:
+        module = importlib.import_module(f"csa.{module_name}")
+    except ImportError:
+        raise ValueError(f"Unknown task module: {module_name}") from None
+    func = getattr(module, func_name, None)
+    if not callable(func):
+        raise ValueError(f"Unknown task: {task}")
+    return func
+
+
+def chunk_ranges(path, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Splits a file into (start, end) byte ranges that begin and end on record boundaries."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                f.seek(end)
+                f.readline()  # finish the record the cut landed in
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _convert_range(task: str, path, start: int, end: int) -> str:
+    convert = resolve(task)
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = data.decode("utf-8").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    results = []
+    for line in lines:
+        line = line.rstrip("\r")
+        try:
+            results.append(str(convert(line)))
+        except Exception as e:
+            results.append(f"Error: {e}")
+    results.append("")
+    return "\n".join(results)
+
+
+def run(task: str, path, out=sys.stdout, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Converts every line of path with the csa function named by task and
+    writes one output line per input line to out, in order. Bad records
+    become 'Error: ...' lines, as in the menus.
+    """
+    resolve(task)  # fail early on a bad task name
+    ranges = chunk_ranges(path, chunk_size)
+    workers = workers or os.cpu_count()
+    # At most two chunks per worker in flight, so finished results waiting
+    # behind a slow chunk cannot pile up in memory.
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start, end in ranges:
+            if len(pending) >= 2 * workers:
+                out.write(pending.popleft().result())
+            pending.append(pool.submit(_convert_range, task, path, start, end))
+        while pending:
+            out.write(pending.popleft().result())
+    out.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a newline-delimited file on all cores.")
+    parser.add_argument("task", help="csa function, e.g. conversions.U2_to_decimal or unicode.shortest_utf8")
+    parser.add_argument("path")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="bytes per chunk")
+    args = parser.parse_args(argv)
+    run(args.task, args.path, sys.stdout, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Even/odd parity over binary buffers: per byte, per word and per frame.
+
+encoding.even_parity_bit / odd_parity_bit count the ones of one bit
+string; this module returns a 0/1 parity bit (uint8) for every element
+of a buffer at once: bytes through the PARITY8 table, words through
+popcount, byte-aligned frames by XOR-folding them into one word, and
+frames of any other bit width by XOR-folding the masked bytes each frame
+covers into one byte.
+"""
+import numpy as np
+
+from ._io import map_file
+from .bitops import POPCOUNT8, popcount
+
+# Even parity of every byte value.
+PARITY8 = POPCOUNT8 & 1
+
+DEFAULT_CHUNK_FRAMES = 1 << 20
+
+
+def _parity_of(bits: np.ndarray, odd: bool) -> np.ndarray:
+    return bits ^ 1 if odd else bits
+
+
+def _aligned_parity(raw: np.ndarray, frame_bytes: int) -> np.ndarray:
+    # XOR the frame's bytes together in the widest lanes that divide it,
+    # then take the parity of what is left
+    lane = next(size for size in (8, 4, 2, 1) if frame_bytes % size == 0)
+    frames = raw.view(f"u{lane}").reshape(-1, frame_bytes // lane)
+    folded = frames[:, 0].copy()
+    for column in range(1, frames.shape[1]):
+        folded ^= frames[:, column]
+    return popcount(folded) & 1
+
+
+def byte_parity(buf, odd: bool = False) -> np.ndarray:
+    """Parity bit of every byte of buf."""
+    return _parity_of(PARITY8[np.frombuffer(buf, dtype=np.uint8)], odd)
+
+
+def word_parity(words, odd: bool = False) -> np.ndarray:
+    """Parity bit of every element of an integer array."""
+    return _parity_of(popcount(words) & 1, odd)
+
+
+def frame_parity(buf, frame_bits: int, odd: bool = False, chunk_frames: int = DEFAULT_CHUNK_FRAMES) -> np.ndarray:
+    """
+    Parity bit of every frame_bits-wide frame of a bit stream packed MSB
+    first into buf. Trailing bits that do not fill a frame are ignored.
+    """
+    if frame_bits < 1:
+        raise ValueError("frame_bits must be positive")
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    count = raw.size * 8 // frame_bits
+    if frame_bits % 8 == 0:
+        return _parity_of(_aligned_parity(raw[: count * frame_bits // 8], frame_bits // 8), odd)
+
+    # Every 8 frames span exactly frame_bits bytes, so the stream is a
+    # table of such groups with frame j always covering the same columns.
+    groups = raw[: count // 8 * frame_bits].reshape(-1, frame_bits)
+    tail = raw[groups.size:(count * frame_bits + 7) // 8]
+    layout = _group_layout(frame_bits)
+    out = np.empty((count + 7) // 8 * 8, dtype=np.uint8)
+    rows = max(chunk_frames // 8, 1)
+    for first in range(0, groups.shape[0], rows):
+        chunk = groups[first:first + rows]
+        out[first * 8:(first + chunk.shape[0]) * 8] = _group_parity(chunk, layout).ravel()
+    if tail.size:
+        padded = np.zeros((1, frame_bits), dtype=np.uint8)
+        padded[0, :tail.size] = tail
+        out[groups.shape[0] * 8:] = _group_parity(padded, layout).ravel()
+    return _parity_of(out[:count], odd)
+
+
+def _group_layout(frame_bits: int):
+    """For each of the 8 frames in a frame_bits-byte group: (column, mask) of the bytes it covers."""
+    layout = []
+    for j in range(8):
+        start, end = j * frame_bits, (j + 1) * frame_bits
+        parts = []
+        for column in range(start // 8, (end - 1) // 8 + 1):
+            lo, hi = max(start, 8 * column) - 8 * column, min(end, 8 * column + 8) - 8 * column
+            parts.append((column, (0xFF >> lo) & (0xFF << (8 - hi)) & 0xFF))
+        layout.append(parts)
+    return layout
+
+
+def _group_parity(groups: np.ndarray, layout) -> np.ndarray:
+    out = np.empty((groups.shape[0], 8), dtype=np.uint8)
+    for j, parts in enumerate(layout):
+        folded = np.zeros(groups.shape[0], dtype=np.uint8)
+        for column, mask in parts:
+            if mask == 0xFF:
+                folded ^= groups[:, column]
+            else:
+                folded ^= groups[:, column] & mask
+        out[:, j] = PARITY8[folded]
+    return out
+
+
+def mismatches(computed, stored) -> np.ndarray:
+    """Indices where a stored parity column disagrees with the computed one."""
+    computed = np.asarray(computed)
+    stored = np.asarray(stored)
+    if computed.shape != stored.shape:
+        raise ValueError("Parity columns must have the same length")
+    return np.flatnonzero((computed ^ stored) & 1)
+
+
+def check_words(words, stored, odd: bool = False) -> np.ndarray:
+    """Indices of the words whose stored parity bit is wrong."""
+    return mismatches(word_parity(words, odd), stored)
+
+
+def check_frames(buf, frame_bits: int, odd: bool = False, chunk_frames: int = DEFAULT_CHUNK_FRAMES) -> np.ndarray:
+    """
+    Indices of bad frames in a stream whose frames carry their own parity
+    bit (e.g. 9-bit serial frames: 8 data bits + parity). A good frame has
+    an even number of ones under even parity, odd under odd parity.
+    """
+    # parity over data + parity bit is 0 (even) or 1 (odd) for a good frame
+    return np.flatnonzero(frame_parity(buf, frame_bits, odd, chunk_frames))
+
+
+def check_file(path, frame_bits: int, odd: bool = False, chunk_frames: int = DEFAULT_CHUNK_FRAMES) -> np.ndarray:
+    """check_frames over a file, mapped into memory rather than read."""
+    with map_file(path) as mm:
+        return check_frames(mm, frame_bits, odd, chunk_frames)
@@ -0,0 +1,165 @@
+"""
+Opt-in instrumentation for the conversion functions.
+
+Enabled by CSA_PROFILE=1 in the environment or by calling enable() (the
+menu scripts do that for --profile). While it is off, install() leaves
+functions untouched and the phase markers inside the hot functions cost
+one attribute check:
+
+    if profiling.ENABLED:
+        profiling.lap("parse")
+
+lap(name) charges the time since the call started (or since the previous
+lap) to that phase of the innermost instrumented call. Marked functions
+use the same two markers, lap("parse") once the input is read and
+lap("compute") once the result is known; the time after the last marker,
+building the returned value, is reported as "format". The converters of
+csa.conversions that parse their input and fxp.add_binary are marked.
+One-step routines (constants, negate_*, extend_*, bin_to_dec,
+hex_to_decimal, decimal_to_bcd, detect_gray_code_order_error) and the
+csa.fxalu operations report totals only.
+
+For every function the report lists call count, latency histogram,
+input-size distribution and per-phase totals; it is written on exit to
+stderr, or to the file named by CSA_PROFILE_OUT.
+"""
+import atexit
+import functools
+import os
+import sys
+import time
+
+ENABLED = os.environ.get("CSA_PROFILE", "") not in ("", "0")
+
+# function name -> {"calls", "total_ns", "latency": {bucket: n}, "sizes": {bucket: n}, "phases": {name: ns}}
+_stats = {}
+# innermost instrumented call last: [record, timestamp of the last lap]
+_active = []
+_atexit_registered = False
+
+
+def enable():
+    global ENABLED, _atexit_registered
+    ENABLED = True
+    if not _atexit_registered:
+        atexit.register(_dump)
+        _atexit_registered = True
+
+
+def _record(name: str) -> dict:
+    record = _stats.get(name)
+    if record is None:
+        record = _stats[name] = {"calls": 0, "total_ns": 0, "latency": {}, "sizes": {}, "phases": {}}
+    return record
+
+
+def _input_size(args) -> int:
+    """Length of a string/bytes argument, or bit length of an int; 0 otherwise."""
+    if not args:
+        return 0
+    first = args[0]
+    if isinstance(first, (str, bytes, bytearray)):
+        return len(first)
+    if isinstance(first, int):
+        return first.bit_length()
+    return 0
+
+
+def instrument(func, name: str = None):
+    """Returns func wrapped with timing when profiling is enabled, func itself otherwise."""
+    if not ENABLED:
+        return func
+    record = _record(name or f"{func.__module__}.{func.__qualname__}")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        frame = [record, start]
+        _active.append(frame)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter_ns()
+            _active.pop()
+            elapsed = end - start
+            record["calls"] += 1
+            record["total_ns"] += elapsed
+            # log2 buckets: bucket b holds latencies in [2^(b-1), 2^b) ns
+            bucket = elapsed.bit_length()
+            record["latency"][bucket] = record["latency"].get(bucket, 0) + 1
+            size = _input_size(args).bit_length()
+            record["sizes"][size] = record["sizes"].get(size, 0) + 1
+            if frame[1] != start:
+                # whatever followed the last lap
+                phases = record["phases"]
+                phases["format"] = phases.get("format", 0) + end - frame[1]
+
+    return wrapper
+
+
+def install(namespace: dict, module: str):
+    """
+    Replaces every public function of module (e.g. "csa.fxp") found in
+    namespace with its instrumented version; a no-op when disabled.
+    namespace is a script's globals() for names imported from module, or
+    vars(module) itself when the script calls through the module.
+    """
+    if not ENABLED:
+        return
+    for name, value in list(namespace.items()):
+        if not name.startswith("_") and callable(value) and getattr(value, "__module__", None) == module:
+            namespace[name] = instrument(value)
+
+
+def lap(phase: str):
+    """Charges the time since the previous lap to phase of the innermost instrumented call."""
+    if not _active:
+        return
+    now = time.perf_counter_ns()
+    frame = _active[-1]
+    phases = frame[0]["phases"]
+    phases[phase] = phases.get(phase, 0) + now - frame[1]
+    frame[1] = now
+
+
+def snapshot() -> dict:
+    return {name: dict(record) for name, record in _stats.items()}
+
+
+def reset():
+    # records stay registered: instrumented wrappers hold references to them
+    for record in _stats.values():
+        record.update(calls=0, total_ns=0, latency={}, sizes={}, phases={})
+
+
+def report(file=sys.stderr):
+    for name, record in sorted(_stats.items(), key=lambda item: -item[1]["total_ns"]):
+        calls = record["calls"]
+        if not calls:
+            continue
+        total_ms = record["total_ns"] / 1e6
+        print(f"{name}: {calls} calls, {total_ms:.3f} ms total, {record['total_ns'] / calls / 1e3:.2f} us/call",
+              file=file)
+        latency = ", ".join(f"<{(1 << b) / 1e3:g}us: {n}" for b, n in sorted(record["latency"].items()))
+        print(f"  latency  {latency}", file=file)
+        sizes = ", ".join(f"<{1 << b}: {n}" for b, n in sorted(record["sizes"].items()))
+        print(f"  input    {sizes}", file=file)
+        if record["phases"]:
+            phases = ", ".join(
+                f"{phase} {ns / 1e6:.3f} ms ({ns / record['total_ns']:.0%})"
+                for phase, ns in sorted(record["phases"].items(), key=lambda item: -item[1])
+            )
+            print(f"  phases   {phases}", file=file)
+
+
+def _dump():
+    path = os.environ.get("CSA_PROFILE_OUT")
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            report(f)
+    else:
+        report()
+
+
+if ENABLED:
+    enable()
@@ -0,0 +1,87 @@
+"""
+Qm.n word layout and rounding rules shared by csa.fxalu and csa.fixed.
+
+A Qm.n word has one sign bit, m integer bits and n fraction bits; values
+are held as scaled integers k = value * 2**n. Both rounding helpers follow
+the same rules for the same mode names:
+
+    trunc         toward zero
+    floor, ceil   toward -inf / +inf
+    nearest       to the nearest integer, halves away from zero
+    nearest_even  to the nearest integer, halves to the even one
+
+div_round rounds an exact quotient of integers; round_float rounds the
+exact value of a float. Neither uses anything beyond arithmetic,
+comparisons and bool operators, so both take Python numbers and NumPy
+arrays alike, and this module needs no NumPy.
+"""
+
+ROUNDING_MODES = ("trunc", "floor", "ceil", "nearest", "nearest_even")
+
+
+def check_rounding(rounding: str):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unsupported rounding mode: {rounding}")
+
+
+def word_bits(int_bits: int, frac_bits: int, max_bits: int = None) -> int:
+    """Width of a Qm.n word: sign + m + n bits, at most max_bits if given."""
+    if int_bits < 0 or frac_bits < 0:
+        raise ValueError("Bit counts must be non-negative")
+    bits = 1 + int_bits + frac_bits
+    if max_bits is not None and bits > max_bits:
+        raise ValueError(f"Fixed-point words are limited to {max_bits} bits")
+    return bits
+
+
+def limits(bits: int):
+    """(min, max) scaled integer of a bits-wide U2 word."""
+    top = 1 << (bits - 1)
+    return -top, top - 1
+
+
+def div_round(num, den, rounding: str = "trunc"):
+    """num / den rounded to an integer."""
+    q, r = divmod(num, den)  # floor division; r has the sign of den
+    if rounding == "floor":
+        return q
+    inexact = r != 0
+    if rounding == "ceil":
+        return q + inexact
+    if rounding == "trunc":
+        return q + (inexact & ((num < 0) != (den < 0)))
+    twice, whole = 2 * abs(r), abs(den)
+    if rounding == "nearest":
+        return q + (twice > whole) + ((twice == whole) & (q >= 0))
+    if rounding == "nearest_even":
+        return q + (twice > whole) + ((twice == whole) & (q % 2 == 1))
+    raise ValueError(f"Unsupported rounding mode: {rounding}")
+
+
+def round_float(x, rounding: str = "nearest", floor=None):
+    """
+    Finite float(s) -> integer-valued float(s). The fraction x - trunc(x)
+    of a float is always exact, so nothing is rounded twice. floor defaults
+    to x // 1; NumPy callers pass np.floor, which is much faster on arrays.
+    """
+    if floor is None:
+        def floor(v):
+            return v // 1
+    down = floor(x)
+    if rounding == "floor":
+        return down
+    inexact = x != down
+    if rounding == "ceil":
+        return down + inexact
+    trunc = down + (inexact & (x < 0))
+    if rounding == "trunc":
+        return trunc
+    frac = abs(x - trunc)
+    if rounding == "nearest":
+        away = frac >= 0.5
+    elif rounding == "nearest_even":
+        odd = floor(trunc * 0.5) * 2 != trunc
+        away = (frac > 0.5) | ((frac == 0.5) & odd)
+    else:
+        raise ValueError(f"Unsupported rounding mode: {rounding}")
+    return trunc + (away & (x > 0)) - (away & (x < 0))
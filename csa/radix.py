@@ -0,0 +1,139 @@
+"""
+Exact conversion of fixed-point numbers between decimal values and any base 2..36.
+
+Digit strings are validated through a per-base translate() table and then
+evaluated with int(), i.e. Horner's scheme in C; long strings are split in
+halves (value = high * base**len(low) + low) so the cost stays subquadratic
+and CPython's int-string length limit never applies. Fractional parts
+become one integer over base**n, so results are exact Fractions, never
+accumulated floats.
+"""
+from decimal import Decimal
+from fractions import Fraction
+from math import gcd, log2
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Strings up to this many digits go straight to int(); longer ones are split.
+_DIRECT_DIGITS = 1000
+# For each base, a str.translate() table that deletes every valid digit,
+# so whatever survives is an invalid character.
+_DELETE_VALID = {
+    base: str.maketrans("", "", DIGITS[:base] + DIGITS[10:base].lower())
+    for base in range(2, 37)
+}
+
+
+def _check_base(base: int):
+    if not 2 <= base <= 36:
+        raise ValueError("Base must be between 2 and 36")
+
+
+def _digits_value(digits: str, base: int) -> int:
+    if len(digits) <= _DIRECT_DIGITS:
+        return int(digits, base) if digits else 0
+    half = len(digits) // 2
+    low = digits[-half:]
+    return _digits_value(digits[:-half], base) * base ** half + _digits_value(low, base)
+
+
+def _split(number: str, base: int):
+    number = number.strip()
+    negative = number.startswith("-")
+    if number[:1] in "+-":
+        number = number[1:]
+    if number.count(".") > 1:
+        raise ValueError("Number must contain at most one '.'")
+    int_part, _, frac_part = number.partition(".")
+    invalid = (int_part + frac_part).translate(_DELETE_VALID[base])
+    if invalid:
+        raise ValueError(f"Invalid base-{base} digit: {invalid[0]}")
+    return negative, int_part, frac_part
+
+
+def _parse(number: str, base: int) -> Fraction:
+    negative, int_part, frac_part = _split(number, base)
+    value = Fraction(_digits_value(int_part, base))
+    if frac_part:
+        value += Fraction(_digits_value(frac_part, base), base ** len(frac_part))
+    return -value if negative else value
+
+
+def parse(number: str, base: int) -> Fraction:
+    """'8A9.BC' in the given base -> exact Fraction."""
+    _check_base(base)
+    return _parse(number, base)
+
+
+def parse_batch(numbers, base: int) -> list:
+    """parse() for an iterable of strings, with the base checked once."""
+    _check_base(base)
+    return [_parse(number, base) for number in numbers]
+
+
+def _int_digits(n: int, base: int, width: int = 0) -> str:
+    if n.bit_length() <= 512:
+        out = []
+        while n:
+            n, d = divmod(n, base)
+            out.append(DIGITS[d])
+        return "".join(reversed(out)).rjust(width, "0") or "0"
+    half = int(n.bit_length() / log2(base)) // 2
+    high, low = divmod(n, base ** half)
+    return _int_digits(high, base, max(width - half, 0)) + _int_digits(low, base, half)
+
+
+def _terminating_digits(denominator: int, base: int):
+    """Smallest k with base**k divisible by denominator, or None if there is none."""
+    k = 0
+    while denominator != 1:
+        g = gcd(denominator, base)
+        if g == 1:
+            return None
+        denominator //= g
+        k += 1
+    return k
+
+
+def format_radix(value, base: int, frac_digits: int = None) -> str:
+    """
+    Exact value (int, Fraction, Decimal, float) -> digit string in base.
+
+    Without frac_digits the fractional part is written out exactly, which
+    requires it to terminate in that base. With frac_digits it is
+    truncated to that many digits.
+    """
+    _check_base(base)
+    value = Fraction(value)
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    int_value = value.numerator // value.denominator
+    frac = value - int_value
+
+    if frac_digits is None:
+        frac_digits = _terminating_digits(frac.denominator, base)
+        if frac_digits is None:
+            raise ValueError(f"Fraction does not terminate in base {base}; pass frac_digits")
+    text = sign + _int_digits(int_value, base)
+    if frac_digits:
+        scaled = frac.numerator * base ** frac_digits // frac.denominator
+        text += "." + _int_digits(scaled, base, frac_digits)
+    return text
+
+
+def convert(number: str, from_base: int, to_base: int, frac_digits: int = None) -> str:
+    """Digit string in from_base -> digit string in to_base."""
+    return format_radix(parse(number, from_base), to_base, frac_digits)
+
+
+def parse_binary(number: str) -> Fraction:
+    """'101100.011' -> Fraction(709, 16): the fraction bits are one integer over 2**n."""
+    return _parse(number, 2)
+
+
+def to_decimal(value) -> Decimal:
+    """
+    Exact Decimal of a value whose fraction terminates in base 10, which
+    is always the case for binary fixed-point numbers (n bits -> n digits).
+    """
+    return Decimal(format_radix(value, 10))
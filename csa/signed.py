@@ -0,0 +1,126 @@
+"""
+Vectorized decoding of raw N-bit words (U2, U1, SM, biased) with NumPy.
+
+Same semantics as U2_to_decimal, U1_to_decimal, sign_magnitude_to_decimal
+and biased_to_decimal in csa.conversions, but for a whole uint array at once.
+Bits above the given width are ignored. Words are at most 64 bits, except
+in wide_fixed_to_float, which takes 128-bit words as hi/lo uint64 halves.
+"""
+import numpy as np
+
+CODE_TYPES = ("U2", "U1", "SM", "biased")
+
+_ONE = np.uint64(1)
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def _words(words, bits: int) -> np.ndarray:
+    if not 1 <= bits <= 64:
+        raise ValueError("Bit width must be between 1 and 64")
+    arr = np.asarray(words)
+    if arr.dtype.kind not in "ui":
+        raise ValueError("Words must be an integer array")
+    arr = arr.astype(np.uint64, copy=False)
+    if bits < 64:
+        arr = arr & np.uint64((1 << bits) - 1)
+    return arr
+
+
+def decode_u2(words, bits: int) -> np.ndarray:
+    """Two's complement: shift the sign bit to bit 63 and shift back arithmetically."""
+    shift = np.int64(64 - bits)
+    return (_words(words, bits).astype(np.int64) << shift) >> shift
+
+
+def decode_u1(words, bits: int) -> np.ndarray:
+    """One's complement: a negative U1 word is one more than the same U2 word (11..1 -> 0)."""
+    val = decode_u2(words, bits)
+    return val + (val < 0)
+
+
+def decode_sm(words, bits: int) -> np.ndarray:
+    """Sign-magnitude: MSB is the sign, the remaining bits are the magnitude."""
+    arr = _words(words, bits)
+    magnitude = (arr & np.uint64((1 << (bits - 1)) - 1)).astype(np.int64)
+    negative = (arr >> np.uint64(bits - 1)).astype(bool)
+    return np.where(negative, -magnitude, magnitude)
+
+
+def decode_biased(words, bits: int) -> np.ndarray:
+    """Biased (excess-K) code with K = 2^(bits-1) - 1, as in biased_to_decimal."""
+    if bits > 63:
+        raise ValueError("Biased code supports at most 63 bits")
+    return _words(words, bits).astype(np.int64) - np.int64((1 << (bits - 1)) - 1)
+
+
+_DECODERS = {
+    "U2": decode_u2,
+    "U1": decode_u1,
+    "SM": decode_sm,
+    "biased": decode_biased,
+}
+
+
+def decode(words, bits: int, code_type: str = "U2") -> np.ndarray:
+    """Decodes an array of raw words to int64 using the given code type."""
+    try:
+        decoder = _DECODERS[code_type]
+    except KeyError:
+        raise ValueError(f"Unsupported code type: {code_type}") from None
+    return decoder(words, bits)
+
+
+def unsigned_fixed_to_float(words, frac_bits: int) -> np.ndarray:
+    """
+    Unsigned binary fixed-point words with frac_bits fraction bits -> float64.
+    Each result is the correctly rounded value of word / 2**frac_bits.
+    """
+    arr = np.asarray(words)
+    if arr.dtype == object:
+        raise ValueError("Words are limited to 64 bits; split wider ones for wide_fixed_to_float")
+    if arr.dtype.kind not in "ui":
+        raise ValueError("Words must be an integer array")
+    return np.ldexp(arr.astype(np.uint64, copy=False).astype(np.float64), -frac_bits)
+
+
+def _bit_length(arr: np.ndarray) -> np.ndarray:
+    """Bit length of every uint64 as int64 (0 for 0)."""
+    # frexp is off by one where the float conversion rounds up to a power of 2
+    length = np.minimum(np.frexp(arr.astype(np.float64))[1], 64)
+    top = _ONE << np.maximum(length - 1, 0).astype(np.uint64)
+    return length - ((arr < top) & (length > 0))
+
+
+def wide_fixed_to_float(hi, lo, frac_bits: int, signed: bool = False) -> np.ndarray:
+    """
+    128-bit fixed-point words given as their high and low uint64 halves
+    -> float64, each correctly rounded. With signed=True the words are U2.
+
+    The value is normalized so its top 64 bits fill one uint64; the bits
+    below that only decide rounding, so they are folded into its lowest
+    bit (a "sticky" bit) before the single uint64 -> float64 conversion.
+    """
+    hi = np.asarray(hi)
+    lo = np.asarray(lo)
+    if hi.dtype.kind not in "ui" or lo.dtype.kind not in "ui":
+        raise ValueError("Words must be integer arrays")
+    hi = hi.astype(np.uint64)
+    lo = lo.astype(np.uint64)
+    negative = (hi >> np.uint64(63)).astype(bool) if signed else np.zeros(hi.shape, dtype=bool)
+    # magnitude of a negative U2 word: ~word + 1 across both halves
+    lo_neg = ~lo + _ONE
+    hi = np.where(negative, ~hi + (lo_neg == 0), hi)
+    lo = np.where(negative, lo_neg, lo)
+
+    shift = (64 - _bit_length(hi)).astype(np.uint64)
+    # (lo >> 1) >> (63 - shift) is lo >> (64 - shift) without a 64-bit shift
+    top = (hi << shift) | ((lo >> _ONE) >> (np.uint64(63) - shift))
+    sticky = (lo & (_ALL_ONES >> shift)) != 0
+    wide = np.ldexp((top | sticky).astype(np.float64), (64 - shift).astype(np.int64) - frac_bits)
+    value = np.where(hi == 0, np.ldexp(lo.astype(np.float64), -frac_bits), wide)
+    return np.where(negative, -value, value)
+
+
+def fixed_to_float(words, bits: int, frac_bits: int, code_type: str = "U2") -> np.ndarray:
+    """Signed fixed-point words (decoded like decode()) -> float64."""
+    return np.ldexp(decode(words, bits, code_type).astype(np.float64), -frac_bits)
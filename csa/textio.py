@@ -0,0 +1,169 @@
+"""
+Bulk parsing and formatting of hex / binary text over byte buffers.
+
+Where encoding.hex_to_binary, binary_to_hex and hex_to_decimal take one
+number, parse() takes a whole buffer of whitespace- or comma-separated
+tokens ("DEAD BEEF\\n0001 ...") and reads them all in one go.
+
+bytes.translate maps every byte to its digit value through a 256-entry
+table; a second table flags separators and invalid bytes. Tokens start
+and end where the byte class changes between digit and separator. Each
+token is read as the window of 16 (hex) or 64 (binary) digit bytes that
+ends at its last digit, packed into one big-endian uint64 and masked to
+the token's length. Formatting runs the other way, one digit column at a
+time through a digit-character table.
+
+    values = textio.parse_file("dump.txt", 16)
+    text = textio.format_hex(values, width=8)
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._io import map_file
+
+SEPARATORS = b" \t\r\n,;"
+DEFAULT_CHUNK_SIZE = 1 << 24
+
+_SEPARATOR = 0x10
+_INVALID = 0xFF
+# bits per digit and digit characters of each supported base
+_BASES = {2: (1, "01"), 16: (4, "0123456789abcdef")}
+
+
+def _build_tables(base: int):
+    """(classify, digits): byte -> digit value / _SEPARATOR / _INVALID, and byte -> digit value or 0."""
+    classify = bytearray([_INVALID]) * 256
+    digits = bytearray(256)
+    for byte in SEPARATORS:
+        classify[byte] = _SEPARATOR
+    for value, char in enumerate(_BASES[base][1]):
+        for byte in {ord(char), ord(char.upper())}:
+            classify[byte] = digits[byte] = value
+    return bytes(classify), bytes(digits)
+
+
+_TABLES = {base: _build_tables(base) for base in _BASES}
+_HEX_CHARS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def _base(base: int):
+    if base not in _BASES:
+        raise ValueError("Only bases 2 and 16 are supported")
+    return _BASES[base][0]
+
+
+def _parse_chunk(data: bytes, base: int, offset: int, big: bool):
+    digit_bits = _base(base)
+    per_word = 64 // digit_bits
+    classify, digits = _TABLES[base]
+    classes = data.translate(classify)
+    bad = classes.find(bytes([_INVALID]))
+    if bad >= 0:
+        raise ValueError(f"Invalid base-{base} character {chr(data[bad])!r} at offset {offset + bad}")
+
+    is_digit = np.frombuffer(classes, dtype=np.uint8) < _SEPARATOR
+    edges = np.flatnonzero(is_digit[1:] != is_digit[:-1]) + 1
+    if is_digit.size and is_digit[0]:
+        edges = np.concatenate([[0], edges])
+    if is_digit.size and is_digit[-1]:
+        edges = np.concatenate([edges, [is_digit.size]])
+    starts, ends = edges[0::2], edges[1::2]
+    if not starts.size:
+        return np.empty(0, dtype=np.uint64)
+    lengths = ends - starts
+
+    # per_word zero bytes in front, so the window ending at any token is whole
+    values = np.frombuffer(bytes(per_word) + data.translate(digits), dtype=np.uint8)
+    windows = sliding_window_view(values, per_word)[ends]
+    if digit_bits == 4:
+        packed = (windows[:, 0::2] << 4) | windows[:, 1::2]
+    else:
+        packed = np.packbits(windows, axis=1)
+    # the window also holds the tail of the previous token; keep our digits only
+    shift = 64 - np.minimum(lengths, per_word) * digit_bits
+    result = packed.view(">u8").ravel().astype(np.uint64) & (_ALL_ONES >> shift.astype(np.uint64))
+
+    long_tokens = np.flatnonzero(lengths > per_word)
+    # tokens with more digits than fit 64 bits (leading zeros or big values)
+    wide = {}
+    for t in long_tokens.tolist():
+        value = int(data[starts[t]:ends[t]], base)
+        if value >> 64 and not big:
+            raise ValueError(f"Token at offset {offset + starts[t]} is wider than 64 bits; use big=True")
+        wide[t] = value
+    if any(value >> 64 for value in wide.values()):
+        result = result.astype(object)
+    for t, value in wide.items():
+        result[t] = value
+    return result
+
+
+def parse(buf, base: int = 16, big: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Every hex (base 16) or binary (base 2) token of buf -> uint64 array.
+    Tokens are separated by whitespace, ',' or ';'. A token wider than 64
+    bits raises ValueError, unless big is True: the result is then an
+    object array of Python ints.
+    """
+    _base(base)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    view = memoryview(buf).cast("B")
+    separators = frozenset(SEPARATORS)
+    parts = []
+    start = 0
+    with view:
+        while start < len(view):
+            end = min(start + chunk_size, len(view))
+            # move the cut forward to a separator so no token is split
+            while end < len(view) and view[end] not in separators:
+                end += 1
+            parts.append(_parse_chunk(bytes(view[start:end]), base, start, big))
+            start = end
+    if not parts:
+        return np.empty(0, dtype=np.uint64)
+    if any(part.dtype == object for part in parts):
+        return np.concatenate([part.astype(object) for part in parts])
+    return np.concatenate(parts)
+
+
+def parse_file(path, base: int = 16, big: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """parse() over a file mapped into memory."""
+    with map_file(path) as mm:
+        return parse(mm, base, big, chunk_size)
+
+
+def _format(values, digit_bits: int, width: int, sep: bytes) -> bytes:
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "ui":
+        raise ValueError("Values must be an integer array")
+    if arr.dtype.kind == "i" and arr.size and arr.min() < 0:
+        raise ValueError("Values must be non-negative")
+    arr = arr.astype(np.uint64, copy=False).ravel()
+    needed = max(int(arr.max()).bit_length(), 1) if arr.size else 1
+    digits = -(-needed // digit_bits)
+    if width is None:
+        width = digits
+    elif width < digits:
+        raise ValueError(f"Values need {digits} digits, more than width {width}")
+    out = np.empty((arr.size, width + len(sep)), dtype=np.uint8)
+    mask = np.uint64((1 << digit_bits) - 1)
+    for column in range(width):
+        shift = (width - 1 - column) * digit_bits
+        if shift >= 64:
+            out[:, column] = ord("0")
+        else:
+            out[:, column] = _HEX_CHARS[(arr >> np.uint64(shift)) & mask]
+    out[:, width:] = np.frombuffer(sep, dtype=np.uint8)
+    return out.tobytes()
+
+
+def format_hex(values, width: int = None, sep: bytes = b"\n") -> bytes:
+    """Non-negative integers -> upper-case hex, zero-padded to width digits, each followed by sep."""
+    return _format(values, 4, width, sep)
+
+
+def format_binary(values, width: int = None, sep: bytes = b"\n") -> bytes:
+    """Non-negative integers -> binary, zero-padded to width bits, each followed by sep."""
+    return _format(values, 1, width, sep)
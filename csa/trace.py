@@ -0,0 +1,207 @@
+"""
+Replays binary ALU traces against the FXP-SIMPLE.py semantics.
+
+A trace file is a 16-byte header (b"CSATRC01" + row count as <u8) and six
+columns stored one after another, so np.memmap can map each of them:
+
+    a, b, expected   <u8 each   operands and expected result (raw words)
+    opcode           u8         one of OPCODES; bit 0x80 = carry in for adds
+    width            u8         word width in bits (1..64)
+    flags            u8         expected NZVC packed as N=8, Z=4, V=2, C=1
+
+Extensions take the source width in b and extend to width. Negations and
+extensions report N and Z of the result, V=1 only for negating the most
+negative U2 word, and C=0, like negate_u1 / negate_u2. Rows are evaluated
+a chunk at a time, grouped by (opcode, width), through csa.alu; only the
+mismatching rows are returned.
+
+    python -m csa.trace alu.trc
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from .alu import add_batch, pack_flags
+
+MAGIC = b"CSATRC01"
+HEADER_SIZE = 16
+
+ADD_U2, ADD_U1, NEG_U2, NEG_U1, NEG_SM, EXT_U, EXT_SM = range(7)
+OPCODES = {
+    ADD_U2: "ADD_U2",
+    ADD_U1: "ADD_U1",
+    NEG_U2: "NEG_U2",
+    NEG_U1: "NEG_U1",
+    NEG_SM: "NEG_SM",
+    EXT_U: "EXT_U",
+    EXT_SM: "EXT_SM",
+}
+CARRY_IN = 0x80
+# got_flags value of rows that cannot be evaluated (bad opcode or width)
+INVALID = 0xFF
+
+MISMATCH_DTYPE = np.dtype([
+    ("row", "<u8"), ("opcode", "u1"), ("width", "u1"), ("a", "<u8"), ("b", "<u8"),
+    ("expected", "<u8"), ("flags", "u1"), ("got", "<u8"), ("got_flags", "u1"),
+])
+
+_ONE = np.uint64(1)
+
+
+def write(path, opcode, width, a, b, expected, flags):
+    """Writes a trace file from equal-length column arrays."""
+    columns = [
+        np.asarray(a, dtype="<u8"), np.asarray(b, dtype="<u8"), np.asarray(expected, dtype="<u8"),
+        np.asarray(opcode, dtype="u1"), np.asarray(width, dtype="u1"), np.asarray(flags, dtype="u1"),
+    ]
+    rows = columns[0].size
+    if any(column.shape != (rows,) for column in columns):
+        raise ValueError("Trace columns must be 1-D arrays of the same length")
+    with open(path, "wb") as f:
+        f.write(MAGIC + rows.to_bytes(8, "little"))
+        for column in columns:
+            column.tofile(f)
+
+
+def open_trace(path) -> dict:
+    """Maps a trace file; returns its columns as read-only memmaps."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or header[:8] != MAGIC:
+        raise ValueError(f"{path} is not a CSA trace file")
+    rows = int.from_bytes(header[8:], "little")
+    columns = {}
+    offset = HEADER_SIZE
+    for name, dtype in (("a", "<u8"), ("b", "<u8"), ("expected", "<u8"),
+                        ("opcode", "u1"), ("width", "u1"), ("flags", "u1")):
+        if rows:
+            columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+        else:
+            columns[name] = np.empty(0, dtype=dtype)
+        offset += rows * np.dtype(dtype).itemsize
+    return columns
+
+
+def _mask(bits: int) -> np.uint64:
+    return np.uint64((1 << bits) - 1)
+
+
+def _nz(result: np.ndarray, bits: int):
+    return (result >> np.uint64(bits - 1)) & _ONE, result == 0
+
+
+def _evaluate(op: int, bits: int, a: np.ndarray, b: np.ndarray, carry: np.ndarray):
+    """(result, packed flags) of one opcode at one width, or None if invalid."""
+    mask = _mask(bits)
+    msb = _ONE << np.uint64(bits - 1)
+    a = a & mask
+    zero = np.zeros(a.shape, dtype=np.uint8)
+    if op in (ADD_U2, ADD_U1):
+        result, _, N, Z, V, C = add_batch(a, b, carry, bits, "U2" if op == ADD_U2 else "U1")
+        return result, pack_flags(N, Z, V, C)
+    if op == NEG_U2:
+        result = (~a + _ONE) & mask
+        N, Z = _nz(result, bits)
+        return result, pack_flags(N, Z, a == msb, zero)
+    if op == NEG_U1:
+        result = ~a & mask
+    elif op == NEG_SM:
+        result = a ^ msb
+    elif op in (EXT_U, EXT_SM):
+        # b is the source width; rows extending from a wider word are invalid
+        source = b.astype(np.int64)
+        valid = (source >= 1) & (source <= bits)
+        top = np.clip(source, 1, 64).astype(np.uint64) - _ONE
+        sign = (a >> top) & _ONE
+        magnitude = a & ((_ONE << top) - _ONE)
+        if op == EXT_U:
+            # repeat the sign bit over every position from the source MSB up
+            result = (magnitude | (sign * (mask ^ ((_ONE << top) - _ONE)))) & mask
+        else:
+            result = magnitude | (sign << np.uint64(bits - 1))
+        N, Z = _nz(result, bits)
+        flags = pack_flags(N, Z, zero, zero)
+        return result, np.where(valid, flags, INVALID).astype(np.uint8)
+    else:
+        return None
+    N, Z = _nz(result, bits)
+    return result, pack_flags(N, Z, zero, zero)
+
+
+def check(columns: dict, start: int = 0, stop: int = None) -> np.ndarray:
+    """Evaluates rows start..stop of mapped columns; returns their mismatches (MISMATCH_DTYPE)."""
+    sl = slice(start, stop)
+    opcode = np.asarray(columns["opcode"][sl])
+    width = np.asarray(columns["width"][sl])
+    a = np.asarray(columns["a"][sl])
+    b = np.asarray(columns["b"][sl])
+    expected = np.asarray(columns["expected"][sl])
+    flags = np.asarray(columns["flags"][sl])
+
+    got = np.zeros(opcode.size, dtype=np.uint64)
+    got_flags = np.full(opcode.size, INVALID, dtype=np.uint8)
+    carry = (opcode >> 7).astype(np.uint64)
+    key = (opcode & 0x7F).astype(np.uint16) << 8 | width
+    # one pass per (opcode, width) group instead of per row
+    order = np.argsort(key, kind="stable")
+    keys, firsts = np.unique(key[order], return_index=True)
+    for k, lo, hi in zip(keys.tolist(), firsts.tolist(), firsts[1:].tolist() + [order.size]):
+        op, bits = k >> 8, k & 0xFF
+        if not 1 <= bits <= 64:
+            continue
+        rows = order[lo:hi]
+        evaluated = _evaluate(op, bits, a[rows], b[rows], carry[rows])
+        if evaluated is not None:
+            got[rows], got_flags[rows] = evaluated
+
+    bad = np.flatnonzero((got != expected) | (got_flags != flags))
+    out = np.empty(bad.size, dtype=MISMATCH_DTYPE)
+    out["row"] = bad + start
+    for name, column in (("opcode", opcode), ("width", width), ("a", a), ("b", b),
+                         ("expected", expected), ("flags", flags), ("got", got), ("got_flags", got_flags)):
+        out[name] = column[bad]
+    return out
+
+
+def replay(path, chunk_rows: int = 1 << 22):
+    """Yields the mismatches of a trace file chunk by chunk."""
+    columns = open_trace(path)
+    rows = columns["opcode"].size
+    for start in range(0, rows, chunk_rows):
+        mismatches = check(columns, start, min(start + chunk_rows, rows))
+        if mismatches.size:
+            yield mismatches
+
+
+def _nzvc(flags: int) -> str:
+    return "invalid" if flags == INVALID else format(flags, "04b")
+
+
+def format_mismatch(m) -> str:
+    op = int(m["opcode"])
+    name = OPCODES.get(op & 0x7F, f"op{op & 0x7F}") + ("+c" if op & CARRY_IN else "")
+    return (f"{int(m['row'])}\t{name}/{int(m['width'])}\ta={int(m['a']):#x} b={int(m['b']):#x}\t"
+            f"expected {int(m['expected']):#x} {_nzvc(int(m['flags']))}\t"
+            f"got {int(m['got']):#x} {_nzvc(int(m['got_flags']))}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay an ALU trace and print the mismatching rows.")
+    parser.add_argument("path")
+    parser.add_argument("--chunk-rows", type=int, default=1 << 22)
+    parser.add_argument("--limit", type=int, default=None, help="print at most this many mismatches")
+    args = parser.parse_args(argv)
+
+    total = 0
+    for mismatches in replay(args.path, args.chunk_rows):
+        for m in mismatches:
+            if args.limit is None or total < args.limit:
+                print(format_mismatch(m))
+            total += 1
+    print(f"{total} mismatching row(s)", file=sys.stderr)
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
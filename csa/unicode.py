@@ -0,0 +1,96 @@
+"""
+Pure versions of the Unicode(L3).py tasks.
+
+Every function raises ValueError where the menu task used to answer "-1".
+"""
+from . import utf8
+
+_INVALID = "invalid UTF-8 input"
+
+
+def codepoint_bits_to_utf8(binary_input: str) -> str:
+    bits = binary_input.replace(' ', '')
+    if len(bits) != 32:
+        raise ValueError(_INVALID)
+    codepoint = int(bits, 2)
+
+    if not (0x000000 <= codepoint <= 0x10FFFF):
+        raise ValueError(_INVALID)
+    # surrogates (D800-DFFF) are rejected by the encoder with ValueError
+    return utf8.format_bits(utf8.encode([codepoint]))
+
+
+def _read_sequence(bytes_str: str):
+    """
+    Parses the menu's '11000010 10100011' input and decodes it the way the
+    L3 tasks always have: utf8.decode_sequence reads the sequence its lead
+    byte announces, and any further bytes must be continuation bytes that
+    each add 6 more bits. Returns (codepoint, info bit count).
+    """
+    groups = bytes_str.split()
+    if not groups:
+        raise ValueError(_INVALID)
+    for group in groups:
+        if len(group) != 8 or group.strip('01'):
+            raise ValueError(_INVALID)
+    data = bytes(int(group, 2) for group in groups)
+
+    try:
+        codepoint, length, _ = utf8.decode_sequence(data)
+    except ValueError:
+        raise ValueError(_INVALID) from None
+    if length == 1 and len(data) != 1:
+        raise ValueError(_INVALID)
+    for byte in data[length:]:
+        if byte & 0xC0 != 0x80:
+            raise ValueError(_INVALID)
+        codepoint = (codepoint << 6) | (byte & 0x3F)
+    return codepoint, utf8.LEAD_MASK[data[0]].bit_length() + 6 * (len(data) - 1)
+
+
+def shortest_utf8(bytes_str: str) -> str:
+    codepoint, _ = _read_sequence(bytes_str)
+    if codepoint > utf8.MAX_CODEPOINT:
+        raise ValueError(_INVALID)
+    return utf8.format_bits(utf8.encode([codepoint]), '.')
+
+
+def utf8_to_ascii_bits(bytes_str: str) -> str:
+    codepoint, _ = _read_sequence(bytes_str)
+    if codepoint > utf8.MAX_CODEPOINT:
+        raise ValueError(_INVALID)
+    ascii_value = codepoint & 0x7F
+    return f"{ascii_value:07b}"
+
+
+# Info bits that fit in a 1..6 byte sequence
+_CAPACITIES = (7, 11, 16, 21, 26, 31)
+
+
+def padded_utf8(bytes_str: str) -> str:
+    """Re-encodes the sequence with two extra leading zero info bits, in the shortest form that holds them."""
+    codepoint, info_bits = _read_sequence(bytes_str)
+    info_bits += 2
+    for length, capacity in enumerate(_CAPACITIES, start=1):
+        if capacity >= info_bits:
+            return utf8.format_bits(utf8.encode_codepoint(codepoint, length), '.')
+    raise ValueError(_INVALID)
+
+
+def utf32_max() -> str:
+    # Maximum value for a 32-bit unsigned integer (all ones)
+    # This is 2^32 - 1 = 4,294,967,295
+    return "11111111 11111111 11111111 11111111"
+
+
+def utf32_min() -> str:
+    # Minimum value for a 32-bit unsigned integer (all zeros)
+    # This is 0
+    return "00000000 00000000 00000000 00000000"
+
+
+def utf32_avg() -> str:
+    # Average value for a 32-bit unsigned integer range (0 to 2^32 - 1)
+    # (0 + (2^32 - 1)) // 2 = (4294967295) // 2 = 2147483647
+    # 2147483647 in binary (32 bits) is 01111111 11111111 11111111 11111111
+    return "01111111 11111111 11111111 11111111"
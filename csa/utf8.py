@@ -0,0 +1,237 @@
+"""
+UTF-8 encoder/decoder over real bytes, with the legacy rules of the L3 tasks.
+
+Well-formed input goes through CPython's built-in codec and stays in C.
+Only where that codec stops (overlong forms, 5/6-byte sequences, surrogates,
+broken bytes) does the pure-Python sequence decoder below take over, and
+only for the one offending sequence.
+
+The "01000001 11000010" text form used by the menu is just presentation:
+see parse_bits() and format_bits().
+"""
+import codecs
+import sys
+from array import array
+
+MAX_CODEPOINT = 0x10FFFF
+# The original (RFC 2279) UTF-8 reaches 31 bits with 6-byte sequences.
+MAX_LEGACY_CODEPOINT = 0x7FFFFFFF
+
+# Largest codepoint that fits in 1..6 bytes.
+_LIMITS = (0x7F, 0x7FF, 0xFFFF, 0x1FFFFF, 0x3FFFFFF, 0x7FFFFFFF)
+_HEADERS = (0x00, 0xC0, 0xE0, 0xF0, 0xF8, 0xFC)
+
+# Codepoint arrays are native-endian; str <-> array goes through UTF-32.
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+_utf32_decode = codecs.utf_32_le_decode if sys.byteorder == "little" else codecs.utf_32_be_decode
+
+DEFAULT_WINDOW = 1 << 24
+RESUME_WINDOW = 1 << 16
+
+
+def _codepoint_array():
+    arr = array("I")
+    if arr.itemsize != 4:
+        arr = array("L")
+    return arr
+
+
+def shortest_length(codepoint: int) -> int:
+    """Number of bytes in the shortest (canonical) encoding of codepoint."""
+    for length, limit in enumerate(_LIMITS, start=1):
+        if codepoint <= limit:
+            return length
+    raise ValueError(f"Codepoint {codepoint:#x} does not fit in 31 bits")
+
+
+def _build_lead_tables():
+    length = bytearray(256)
+    mask = bytearray(256)
+    # (first lead byte, last lead byte, sequence length, payload mask)
+    for first, last, n, payload in (
+        (0x00, 0x7F, 1, 0x7F),
+        (0xC0, 0xDF, 2, 0x1F),
+        (0xE0, 0xEF, 3, 0x0F),
+        (0xF0, 0xF7, 4, 0x07),
+        (0xF8, 0xFB, 5, 0x03),
+        (0xFC, 0xFD, 6, 0x01),
+    ):
+        for byte in range(first, last + 1):
+            length[byte] = n
+            mask[byte] = payload
+    return bytes(length), bytes(mask)
+
+
+# Lead byte -> sequence length (0 = not a lead byte) and payload mask.
+# Continuation bytes (10xxxxxx) and 0xFE/0xFF have length 0.
+LEAD_LENGTH, LEAD_MASK = _build_lead_tables()
+
+
+def lead_info(byte: int):
+    """Returns (sequence length, payload bits) for a lead byte, or None."""
+    length = LEAD_LENGTH[byte]
+    if not length:
+        return None
+    return length, byte & LEAD_MASK[byte]
+
+
+def decode_sequence(data, pos: int = 0):
+    """
+    Decodes one sequence at data[pos] with the legacy rules (1-6 bytes,
+    overlong forms allowed). Returns (codepoint, length, overlong).
+    """
+    lead = data[pos]
+    length = LEAD_LENGTH[lead]
+    if not length:
+        raise ValueError(f"Invalid UTF-8 lead byte {lead:#04x} at offset {pos}")
+    codepoint = lead & LEAD_MASK[lead]
+    if pos + length > len(data):
+        raise ValueError(f"Truncated UTF-8 sequence at offset {pos}")
+    for i in range(pos + 1, pos + length):
+        byte = data[i]
+        if byte & 0xC0 != 0x80:
+            raise ValueError(f"Invalid UTF-8 continuation byte {byte:#04x} at offset {i}")
+        codepoint = (codepoint << 6) | (byte & 0x3F)
+    return codepoint, length, length > shortest_length(codepoint)
+
+
+def sequence_span(data, pos: int) -> int:
+    """
+    Number of bytes the (possibly broken) sequence at data[pos] covers: its
+    lead byte and the continuation bytes that follow, up to the length the
+    lead byte announces. A byte that cannot start a sequence spans 1.
+    """
+    length = LEAD_LENGTH[data[pos]]
+    stop = min(pos + length, len(data))
+    for i in range(pos + 1, stop):
+        if data[i] & 0xC0 != 0x80:
+            return i - pos
+    return max(stop - pos, 1)
+
+
+def iter_runs(view, chunk_size: int = DEFAULT_WINDOW):
+    """
+    Walks a byte view with the built-in codec, at most chunk_size bytes at
+    a time. Yields (start, stop, text) for every well-formed run and
+    (start, stop, None) for every sequence the codec rejects.
+
+    After a rejected sequence the codec resumes on a RESUME_WINDOW-byte
+    window, doubled back up to chunk_size while the data stays clean: each
+    error costs the codec a copy of its window, so error-dense input must
+    not restart it on a large one.
+    """
+    size = len(view)
+    window = chunk_size
+    pos = 0
+    while pos < size:
+        end = min(pos + window, size)
+        try:
+            # final=False stops before a sequence cut by the window edge,
+            # the next window starts there.
+            text, consumed = codecs.utf_8_decode(view[pos:end], "strict", end == size)
+        except UnicodeDecodeError as e:
+            bad = pos + e.start
+            if e.start:
+                yield pos, bad, codecs.utf_8_decode(view[pos:bad], "strict", True)[0]
+            stop = bad + sequence_span(view, bad)
+            yield bad, stop, None
+            pos = stop
+            window = min(RESUME_WINDOW, chunk_size)
+            continue
+        if consumed:
+            yield pos, pos + consumed, text
+        pos += consumed
+        window = min(window * 2, chunk_size)
+
+
+def decode(data, legacy: bool = False) -> array:
+    """
+    Decodes a bytes-like buffer to an array of codepoints.
+
+    In strict mode anything the standard codec rejects raises ValueError.
+    With legacy=True overlong forms, surrogates and 5/6-byte sequences up
+    to 0x7FFFFFFF are accepted, like the L3 tasks do.
+    """
+    view = memoryview(data).cast("B")
+    result = _codepoint_array()
+    if not legacy:
+        try:
+            text, _ = codecs.utf_8_decode(view, "strict", True)
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Invalid UTF-8 at offset {e.start}: {e.reason}") from None
+        result.frombytes(text.encode(_UTF32))
+        return result
+    for start, _, text in iter_runs(view):
+        if text is None:
+            result.append(decode_sequence(view, start)[0])
+        else:
+            result.frombytes(text.encode(_UTF32))
+    return result
+
+
+def encode_codepoint(codepoint: int, length: int = None) -> bytes:
+    """
+    Encodes one codepoint with the legacy scheme. length forces a longer
+    (overlong) form; by default the shortest one is used.
+    """
+    if not 0 <= codepoint <= MAX_LEGACY_CODEPOINT:
+        raise ValueError(f"Codepoint {codepoint:#x} out of range")
+    shortest = shortest_length(codepoint)
+    if length is None:
+        length = shortest
+    elif not shortest <= length <= 6:
+        raise ValueError(f"Codepoint {codepoint:#x} cannot be encoded in {length} bytes")
+    if length == 1:
+        return bytes((codepoint,))
+    out = bytearray(length)
+    for i in range(length - 1, 0, -1):
+        out[i] = 0x80 | (codepoint & 0x3F)
+        codepoint >>= 6
+    out[0] = _HEADERS[length - 1] | codepoint
+    return bytes(out)
+
+
+def encode(codepoints, legacy: bool = False) -> bytes:
+    """
+    Encodes a sequence of codepoints to UTF-8 bytes (shortest forms).
+    With legacy=True surrogates and codepoints above 0x10FFFF are written
+    in the original 4..6-byte scheme instead of raising ValueError.
+    """
+    if isinstance(codepoints, array) and codepoints.typecode in "IL" and codepoints.itemsize == 4:
+        arr = codepoints
+    else:
+        arr = _codepoint_array()
+        try:
+            arr.extend(codepoints.tolist() if isinstance(codepoints, array) else codepoints)
+        except OverflowError:
+            raise ValueError("Codepoint out of range") from None
+    raw = memoryview(arr).cast("B")
+    out = bytearray()
+    pos = 0
+    while pos < len(raw):
+        try:
+            out += _utf32_decode(raw[pos:], "strict", True)[0].encode("utf-8")
+            break
+        except UnicodeDecodeError as e:
+            bad = pos + e.start
+            out += _utf32_decode(raw[pos:bad], "strict", True)[0].encode("utf-8")
+            codepoint = arr[bad // 4]
+            if not legacy:
+                raise ValueError(f"Codepoint {codepoint:#x} is not encodable in UTF-8") from None
+            out += encode_codepoint(codepoint)
+            pos = bad + 4
+    return bytes(out)
+
+
+def parse_bits(text: str) -> bytes:
+    """'11000010 10100011' (spaces or dots between bytes) -> b'\\xc2\\xa3'."""
+    groups = text.replace(".", " ").split()
+    for group in groups:
+        if len(group) != 8 or group.strip("01"):
+            raise ValueError(f"Invalid byte '{group}': expected 8 binary digits")
+    return bytes(int(group, 2) for group in groups)
+
+
+def format_bits(data, sep: str = " ") -> str:
+    """b'\\xc2\\xa3' -> '11000010 10100011'."""
+    return sep.join(f"{byte:08b}" for byte in bytes(data))
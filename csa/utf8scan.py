@@ -0,0 +1,99 @@
+"""
+Scans (arbitrarily large) files for non-canonical or broken UTF-8 via mmap.
+
+The file is never read into memory: the built-in codec validates memoryview
+windows of the mapping, and only the offsets where it stops are looked at
+byte by byte. Every overlong sequence, invalid lead or continuation byte,
+surrogate and out-of-range codepoint is reported with its file offset.
+Optionally a canonicalized copy is written, with overlong sequences replaced
+by their shortest form and everything else by U+FFFD.
+
+    python -m csa.utf8scan big.log [-o clean.log]
+"""
+import argparse
+import sys
+
+from . import utf8
+from ._io import map_file
+
+REPLACEMENT = "\ufffd".encode("utf-8")
+
+
+def _classify(view, pos: int, length: int):
+    """Returns (kind, detail, replacement bytes) for the rejected length-byte sequence at pos."""
+    lead = view[pos]
+    info = utf8.lead_info(lead)
+    if info is None:
+        return "invalid_lead", f"byte {lead:#04x}", REPLACEMENT
+    if length < info[0]:
+        if pos + length < len(view):
+            return "invalid_continuation", f"byte {view[pos + length]:#04x} at +{length}", REPLACEMENT
+        return "truncated", f"{length} of {info[0]} bytes", REPLACEMENT
+
+    codepoint, length, overlong = utf8.decode_sequence(view, pos)
+    encodable = codepoint <= utf8.MAX_CODEPOINT and not 0xD800 <= codepoint <= 0xDFFF
+    if overlong:
+        canonical = utf8.encode_codepoint(codepoint) if encodable else REPLACEMENT
+        return "overlong", f"U+{codepoint:04X} in {length} bytes", canonical
+    if codepoint > utf8.MAX_CODEPOINT:
+        return "out_of_range", f"U+{codepoint:04X}", REPLACEMENT
+    # the shortest form of U+D800..U+DFFF is ED A0..BF xx
+    if lead == 0xED and 0xA0 <= view[pos + 1] <= 0xBF:
+        return "surrogate", f"U+{codepoint:04X}", REPLACEMENT
+    return "invalid", bytes(view[pos:pos + length]).hex(" "), REPLACEMENT
+
+
+def scan_buffer(view, output=None, chunk_size: int = utf8.DEFAULT_WINDOW):
+    """
+    Yields (offset, kind, detail) for every problem in a bytes-like buffer.
+    If output (a binary file object) is given, the canonicalized bytes are
+    written to it as the scan goes. The codec reads at most chunk_size
+    bytes at a time, fewer right after a problem (see utf8.iter_runs).
+    """
+    if chunk_size < 64:
+        raise ValueError("chunk_size must be at least 64 bytes")
+    view = memoryview(view).cast("B")
+    for start, stop, text in utf8.iter_runs(view, chunk_size):
+        if text is not None:
+            if output is not None:
+                output.write(view[start:stop])
+            continue
+        kind, detail, replacement = _classify(view, start, stop - start)
+        if output is not None:
+            output.write(replacement)
+        yield start, kind, detail
+
+
+def scan_file(path, output_path=None, chunk_size: int = utf8.DEFAULT_WINDOW):
+    """Memory-maps path and yields (offset, kind, detail) like scan_buffer()."""
+    with map_file(path) as mapped:
+        out = open(output_path, "wb") if output_path else None
+        try:
+            view = memoryview(mapped)
+            try:
+                yield from scan_buffer(view, out, chunk_size)
+            finally:
+                view.release()
+        finally:
+            if out is not None:
+                out.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report overlong / invalid UTF-8 sequences in a file.")
+    parser.add_argument("path")
+    parser.add_argument("-o", "--output", help="write a canonicalized copy here")
+    parser.add_argument("--chunk-size", type=int, default=utf8.DEFAULT_WINDOW)
+    args = parser.parse_args(argv)
+
+    counts = {}
+    for offset, kind, detail in scan_file(args.path, args.output, args.chunk_size):
+        counts[kind] = counts.get(kind, 0) + 1
+        print(f"{offset}\t{kind}\t{detail}")
+    summary = ", ".join(f"{kind}: {n}" for kind, n in sorted(counts.items())) or "no problems"
+    print(summary, file=sys.stderr)
+    return 1 if counts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Width conversion of raw integer words over NumPy arrays.
+
+fxp.extend_u / extend_sm / sign_extend work on bit strings; this module
+works on unsigned raw bit patterns (uint64 in, uint64 out), converted
+between any widths of 1..64 bits with masks and shifts:
+
+    sign_extend   U1/U2: repeat the sign bit
+    zero_extend   unsigned: pad with zeros
+    sm_extend     sign-magnitude: move the sign bit up, keep the magnitude
+    truncate      keep the low bits, optionally checking nothing was lost
+
+unpack_12bit reads 12-bit samples packed two per three bytes into int16
+(signed) or uint16 through csa.packed, which handles any sample width.
+"""
+import numpy as np
+
+from . import packed
+
+_ONE = np.uint64(1)
+
+
+def _check_bits(bits: int):
+    if not 1 <= bits <= 64:
+        raise ValueError("Bit width must be between 1 and 64")
+
+
+def _mask(bits: int) -> np.uint64:
+    return np.uint64((1 << bits) - 1)
+
+
+def _words(words, bits: int) -> np.ndarray:
+    _check_bits(bits)
+    arr = np.asarray(words)
+    if arr.dtype.kind not in "ui":
+        raise ValueError("Words must be an integer array")
+    if arr.dtype.kind == "i" and arr.size and arr.min() < 0:
+        raise ValueError("Words must be raw (non-negative) bit patterns")
+    arr = arr.astype(np.uint64, copy=False)
+    if bits < 64 and arr.size and (arr >> np.uint64(bits)).any():
+        raise ValueError(f"Words do not fit in {bits} bits")
+    return arr
+
+
+def _widths(from_bits: int, to_bits: int):
+    _check_bits(to_bits)
+    if to_bits < from_bits:
+        raise ValueError("Target bits less than current bits.")
+
+
+def sign_extend(words, from_bits: int, to_bits: int) -> np.ndarray:
+    """U1/U2 words of from_bits -> to_bits by repeating the sign bit."""
+    arr = _words(words, from_bits)
+    _widths(from_bits, to_bits)
+    shift = np.uint64(64 - from_bits)
+    # move the sign bit to bit 63, shift back arithmetically, cut to to_bits
+    extended = ((arr << shift).view(np.int64) >> shift.astype(np.int64)).view(np.uint64)
+    return extended & _mask(to_bits)
+
+
+def zero_extend(words, from_bits: int, to_bits: int) -> np.ndarray:
+    """Unsigned words of from_bits -> to_bits; the bit pattern is unchanged."""
+    arr = _words(words, from_bits)
+    _widths(from_bits, to_bits)
+    return arr.copy()
+
+
+def sm_extend(words, from_bits: int, to_bits: int) -> np.ndarray:
+    """Sign-magnitude words of from_bits -> to_bits: sign to the new MSB, magnitude zero-padded."""
+    arr = _words(words, from_bits)
+    _widths(from_bits, to_bits)
+    old_sign = _ONE << np.uint64(from_bits - 1)
+    sign = (arr & old_sign) >> np.uint64(from_bits - 1)
+    return (arr & (old_sign - _ONE)) | (sign << np.uint64(to_bits - 1))
+
+
+def truncate(words, from_bits: int, to_bits: int, code_type: str = None) -> np.ndarray:
+    """
+    Cuts from_bits words down to to_bits. Without code_type the low bits are
+    kept as they are; with "unsigned", "U1", "U2" or "SM" the word is cut in
+    that code and any word whose value would change raises ValueError.
+    """
+    arr = _words(words, from_bits)
+    _check_bits(to_bits)
+    if to_bits > from_bits:
+        raise ValueError("Target bits greater than current bits.")
+    result = arr & _mask(to_bits)
+    if code_type is None:
+        return result
+    if code_type == "unsigned":
+        fits = result == arr
+    elif code_type in ("U1", "U2"):
+        fits = sign_extend(result, to_bits, from_bits) == arr
+    elif code_type == "SM":
+        magnitude = arr & _mask(from_bits - 1)
+        sign = arr >> np.uint64(from_bits - 1)
+        fits = magnitude <= _mask(to_bits - 1)
+        result = (magnitude & _mask(to_bits - 1)) | (sign << np.uint64(to_bits - 1))
+    else:
+        raise ValueError(f"Unsupported code type: {code_type}")
+    lost = np.flatnonzero(~fits)
+    if lost.size:
+        raise ValueError(
+            f"Word {int(arr[lost[0]]):#x} at index {lost[0]} does not fit in {to_bits} bits "
+            f"({lost.size} word(s) in total)"
+        )
+    return result
+
+
+def unpack_12bit(buf, signed: bool = True) -> np.ndarray:
+    """
+    12-bit samples packed two per three bytes, MSB first (byte 0 and the
+    high nibble of byte 1 form the first sample) -> int16 (U2) or uint16.
+    packed.unpack with bits=12, narrowed to 16-bit results.
+    """
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    if raw.size % 3:
+        raise ValueError("Buffer length is not a multiple of 3 bytes")
+    if signed:
+        return packed.unpack(raw, 12, "U2").astype(np.int16)
+    return packed.unpack_raw(raw, 12).astype(np.uint16)